@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import (
     Any,
@@ -43,6 +44,24 @@ class DataManager(ABC, Generic[T]):
         """
         pass
 
+    @abstractmethod
+    async def get_by_ids(
+        self,
+        element_ids: list[str],
+        artifact_type: type[T],
+        tag: str | None = None
+    ) -> list[T]:
+        """
+        Retrieves several artifacts of the same type by their IDs in a single query.
+        IDs that are not found are omitted and the result order is not guaranteed.
+        
+        Args:
+            element_ids: The IDs of the elements to retrieve
+            artifact_type: The type of the artifacts
+            tag: Optional tag to narrow down the store search
+        """
+        pass
+
     @abstractmethod
     async def get_children(
         self,
@@ -60,6 +79,26 @@ class DataManager(ABC, Generic[T]):
         """
         pass
 
+    @abstractmethod
+    def iter_children(
+        self,
+        root_id: str,
+        child_type: type[T],
+        tag: str | None = None,
+        page_size: int = 500
+    ) -> AsyncIterator[T]:
+        """
+        Asynchronously iterates over all children of a specific type for a given parent,
+        fetching them from the store one page at a time.
+        
+        Args:
+            root_id: The parent ID
+            child_type: The type of children to retrieve
+            tag: Optional tag to narrow down the store search
+            page_size: Number of children fetched per store round-trip
+        """
+        pass
+
     @abstractmethod
     async def get_children_for_list(
         self,
@@ -175,6 +214,41 @@ class DataManager(ABC, Generic[T]):
         """
         pass
 
+    @abstractmethod
+    async def get_traces_by_ids(
+        self,
+        trace_ids: list[str],
+        tag: str | None = None
+    ) -> list[T]:
+        """
+        Return the trace objects for the given trace ids, fetching their spans in a single query.
+        Trace ids without spans are omitted and the result order is not guaranteed.
+        
+        Args:
+            trace_ids: IDs of the traces
+            tag: Optional tag to narrow down which spans to retrieve
+        """
+        pass
+
+    @abstractmethod
+    async def aggregate_trace_metrics(
+        self,
+        trace_ids: list[str],
+        tag: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Compute aggregate metrics over the given traces without materializing trace objects.
+        
+        Args:
+            trace_ids: IDs of the traces to aggregate
+            tag: Optional tag to narrow down which spans to retrieve
+            
+        Returns:
+            Dictionary with avg_duration, stddev_duration, min_duration, max_duration,
+            success_rate, total_traces and failure_count
+        """
+        pass
+
     @abstractmethod
     async def get_spans(
         self,
@@ -7,6 +7,20 @@ from pydantic import Field
 # Type variable for ElementData subclasses
 E = TypeVar('E', bound='ElementData')
 
+# Bumped whenever an element data or composite class is defined, so cached
+# subclass walks know the class hierarchy changed
+_class_generation = 0
+
+
+def _bump_class_generation() -> None:
+    global _class_generation
+    _class_generation += 1
+
+
+def class_generation() -> int:
+    """Number of element data and composite classes defined so far"""
+    return _class_generation
+
 class ElementData(ABC,Element):
     root_id: str | None = Field(
         description='The identifier of the composite data element', default=None
@@ -16,6 +30,10 @@ class ElementData(ABC,Element):
         description='The identifier of the analytics which created this object', default=None
     )
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _bump_class_generation()
+
 
 
     def to_json(self, indent: int = 2, sort_keys: bool = True) -> str:
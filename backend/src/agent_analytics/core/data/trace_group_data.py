@@ -1,5 +1,6 @@
+import sys
 from typing import List
-from pydantic import Field
+from pydantic import Field, field_validator
 from agent_analytics.core.data.element_data import ElementData
 
 class TraceGroupData(ElementData):
@@ -12,4 +13,10 @@ class TraceGroupData(ElementData):
     avg_duration: float | None = Field(None, description="Average duration across all traces in seconds")
     success_rate: float | None = Field(None, description="Success rate across all traces (0.0 to 1.0)")
     total_traces: int = Field(0, description="Total number of traces in the group")
-    failure_count: int = Field(0, description="Number of failed traces")
\ No newline at end of file
+    failure_count: int = Field(0, description="Number of failed traces")
+
+    @field_validator('service_name')
+    @classmethod
+    def intern_service_name(cls, v: str) -> str:
+        # Many trace groups share a handful of service names - keep one copy of each
+        return sys.intern(v)
\ No newline at end of file
@@ -1,12 +1,34 @@
+import sys
 
 from agent_analytics_common.interfaces.iunits import Relation
-from pydantic import Field
+from pydantic import ConfigDict, Field, field_serializer, field_validator
 
 from agent_analytics.core.data.element_data import ElementData
 
 
 class WorkflowEdgeData(ElementData, Relation):
+    # Workflow edges are immutable once built, their composites memoize results keyed on them
+    model_config = ConfigDict(frozen=True)
+
+    # Immutable ID sequences, so equal ones can be shared between edges and used as cache keys
+    source_ids: tuple[str, ...] | None = Field(
+        None, description="Optional list of source intelligent units IDs."
+    )
+    destination_ids: tuple[str, ...] | None = Field(
+        None, description="Optional list of destination intelligent units IDs."
+    )
     source_category: str = Field(description="The category of the source node")
     parent_id: str = Field(description="The ID of the parent workflow")
     destination_category: str = Field(description="The category of the destination node")
     trace_count: int = Field(description="Counter for the number of tasks", default=0)
+
+    @field_serializer('source_ids', 'destination_ids')
+    def serialize_ids(self, ids: tuple[str, ...] | None) -> list[str] | None:
+        """Dump the ID sequences as lists, as the stores and their array queries expect"""
+        return list(ids) if ids is not None else None
+
+    @field_validator('relation_type', 'source_category', 'destination_category')
+    @classmethod
+    def intern_categories(cls, v):
+        # These take a handful of distinct values across all edges - keep one copy of each
+        return sys.intern(v) if type(v) is str else v
@@ -1,12 +1,22 @@
+import sys
 
-from pydantic import Field
+from pydantic import ConfigDict, Field, field_validator
 
 from agent_analytics.core.data.element_data import ElementData
 
 
 class WorkflowNodeData(ElementData):
+    # Workflow nodes are immutable once built, their composites memoize results keyed on them
+    model_config = ConfigDict(frozen=True)
+
     node_type: str = Field(description="The type of the workflow node")
     parent_id: str = Field(description="The ID of the parent workflow")
     action_id: str = Field(description="The ID of the associated action")
     task_counter: int = Field(description="Counter for the number of tasks", default=0)
     trace_counter: int = Field(description="Counter for the number of tasks", default=0)
+
+    @field_validator('node_type')
+    @classmethod
+    def intern_node_type(cls, v: str) -> str:
+        # Node types take a handful of distinct values across all nodes - keep one copy of each
+        return sys.intern(v) if type(v) is str else v
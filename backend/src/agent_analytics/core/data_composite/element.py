@@ -1,11 +1,17 @@
-from abc import ABC, abstractmethod
-from typing import ClassVar, Generic, TypeVar, Type, Optional, List, Dict, Any
+import asyncio
 import inspect
+import weakref
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any, ClassVar, Dict, Generic, List, Optional, Type, TypeVar
 
+from pydantic import BaseModel, PrivateAttr
 
-
-
-from agent_analytics.core.data.element_data import ElementData, E
+from agent_analytics.core.data.element_data import (
+    E,
+    ElementData,
+    _bump_class_generation,
+)
 
 # A unique object instance to act as a private creation token
 _CREATION_TOKEN = object()
@@ -21,8 +27,16 @@ class ElementComposite(ABC,Generic[E]):
     and may have references to other Element objects
     """
     
+    # Subclasses that declare __slots__ themselves carry no per-instance __dict__;
+    # the others keep one as before
+    __slots__ = ('_data_manager', '_data_object', '__weakref__')
+
     # Class variable that specifies the corresponding data class
     data_class: ClassVar[Type[ElementData]] = ElementData
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _bump_class_generation()
     
     @classmethod
     def get_element_class_for_data(cls, data_object: ElementData) -> Type['ElementComposite']:
@@ -153,4 +167,60 @@ class ElementComposite(ABC,Generic[E]):
         element_class = cls.get_element_class_for_data(data_object)
         
         # Create a new instance with the creation token
-        return element_class(data_manager, data_object, _token=_CREATION_TOKEN)
\ No newline at end of file
+        return element_class(data_manager, data_object, _token=_CREATION_TOKEN)
+
+
+def _no_root_id(root: None) -> None:
+    return None
+
+
+def _element_root_id(root: "ElementComposite") -> str:
+    return root.element_id
+
+
+# Root id extraction keyed by the concrete root type, so the isinstance checks run once per type
+_ROOT_ID_GETTERS: dict[type, Callable[[Any], str | None]] = {
+    type(None): _no_root_id,
+    str: str,
+}
+
+
+def _get_root_id(root: ElementComposite | str | None) -> str | None:
+    getter = _ROOT_ID_GETTERS.get(type(root))
+    if getter is None:
+        if isinstance(root, ElementComposite):
+            getter = _element_root_id
+        elif isinstance(root, str):
+            getter = str
+        else:
+            raise TypeError("root must be either an Element object or a string ID")
+        _ROOT_ID_GETTERS[type(root)] = getter
+    return getter(root)
+
+
+async def _bulk_store_in_chunks(data_manager: "DataManager", composites: list, chunk_size: int) -> None:
+    """Store composites with one data manager bulk_store call per chunk, the chunks concurrently"""
+    if len(composites) <= chunk_size:
+        await data_manager.bulk_store(composites)
+        return
+    await asyncio.gather(*(
+        data_manager.bulk_store(composites[i:i + chunk_size])
+        for i in range(0, len(composites), chunk_size)
+    ))
+
+
+class _StoreTrackedBuilder(BaseModel):
+    """
+    Builder mixin remembering the data managers the builder was written to, so builders
+    shared across trace workflows are written only once per data manager. Each data manager
+    is remembered with a snapshot of the builder's content, so a builder edited in any way -
+    a field assigned, or a list or dict field changed in place - is written again on its next store.
+    """
+    _stored_in: weakref.WeakKeyDictionary = PrivateAttr(default_factory=weakref.WeakKeyDictionary)
+
+    def _mark_stored(self, data_manager: "DataManager") -> None:
+        self._stored_in[data_manager] = self.model_dump()
+
+    def _is_stored_in(self, data_manager: "DataManager") -> bool:
+        snapshot = self._stored_in.get(data_manager)
+        return snapshot is not None and snapshot == self.model_dump()
@@ -566,6 +566,17 @@ class BaseBasicStatsMetric(BaseMetric[AggregatedStats], BasicStatsMetric):
     metric_type: Literal[MetricType.STATISTICS] = MetricType.STATISTICS
 
 
+# Builder class for each metric type
+METRIC_BUILDER_CLASSES: dict[MetricType, type[BaseMetric]] = {
+    MetricType.NUMERIC: BaseNumericMetric,
+    MetricType.STRING: BaseStringMetric,
+    MetricType.DISTRIBUTION: BaseDistributionMetric,
+    MetricType.TIME_SERIES: BaseTimeSeriesMetric,
+    MetricType.HISTOGRAM: BaseHistogramMetric,
+    MetricType.STATISTICS: BaseBasicStatsMetric,
+}
+
+
 # Factory function to create the appropriate MetricBuilder based on metric type
 def create_metric_model(metric_type: MetricType, **kwargs):
     """
@@ -578,20 +589,7 @@ def create_metric_model(metric_type: MetricType, **kwargs):
     Returns:
         The appropriate MetricBuilder instance
     """
-    if metric_type == MetricType.NUMERIC:
-        return BaseNumericMetric(**kwargs)
-    elif metric_type == MetricType.STRING:
-        return BaseStringMetric(**kwargs)
-    elif metric_type == MetricType.DISTRIBUTION:
-        return BaseDistributionMetric(**kwargs)
-    elif metric_type == MetricType.TIME_SERIES:
-        return BaseTimeSeriesMetric(**kwargs)
-    elif metric_type == MetricType.HISTOGRAM:
-        return BaseHistogramMetric(**kwargs)
-    elif metric_type == MetricType.STATISTICS:
-        return BaseBasicStatsMetric(**kwargs)
-    else:
+    builder_class = METRIC_BUILDER_CLASSES.get(metric_type)
+    if builder_class is None:
         raise ValueError(f"Unsupported metric type: {metric_type}")
-
-
-
+    return builder_class(**kwargs)
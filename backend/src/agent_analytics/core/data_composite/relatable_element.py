@@ -6,6 +6,7 @@ from agent_analytics.core.data.relatable_element_data import RelatableElementDat
 R = TypeVar('R', bound=RelatableElementData)
 
 class RelatableElementComposite(ElementComposite[R], Generic[R],metaclass=ABCMeta):
+    __slots__ = ()
        
     def __init__(self, data_manager: "DataManager", reletable_element_data: R,*, _token: object = None):
         super().__init__(data_manager, reletable_element_data, _token=_token)
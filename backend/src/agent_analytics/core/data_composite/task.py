@@ -1,22 +1,70 @@
+import asyncio
 import uuid
-from datetime import datetime
+import weakref
+from collections import defaultdict
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 from typing import Any, ClassVar, Dict, Optional, List
 
-from agent_analytics.core.data_composite.element import ElementComposite,_CREATION_TOKEN
-from agent_analytics.core.data_composite.issue import BaseIssue, IssueComposite
-from agent_analytics.core.data_composite.metric import BaseMetric, MetricComposite
-from agent_analytics.runtime.storage.store_interface import QueryFilter, QueryOperator
 from agent_analytics_common.interfaces.graph import Graph
 from agent_analytics_common.interfaces.metric import MetricType
 from agent_analytics_common.interfaces.task import Task, TaskStatus, TaskTag
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from agent_analytics.core.data.task_data import TaskData
 from agent_analytics.core.data_composite.action import ActionComposite
 from agent_analytics.core.data_composite.annotation import AnnotationComposite
-from agent_analytics.core.data_composite.element import _CREATION_TOKEN, ElementComposite
+from agent_analytics.core.data_composite.element import _CREATION_TOKEN, ElementComposite, _get_root_id
 from agent_analytics.core.data_composite.issue import BaseIssue, IssueComposite
-from agent_analytics.core.data_composite.metric import BaseMetric, MetricComposite
+from agent_analytics.core.data_composite.metric import (
+    METRIC_BUILDER_CLASSES,
+    BaseMetric,
+    MetricComposite,
+)
+from agent_analytics.core.utilities.batch_loader import BatchLoader
+from agent_analytics.core.utilities.json_utils import json_loads
+from agent_analytics.runtime.storage.store_interface import QueryFilter, QueryOperator
+
+# The parent loader of each data manager for the current event loop tick, coalescing
+# concurrent parent lookups into a single search
+_parent_loaders: "weakref.WeakKeyDictionary[DataManager, BatchLoader[str, TaskComposite]]" = weakref.WeakKeyDictionary()
+
+
+def _forget_parent_loader(data_manager_ref: "weakref.ref[DataManager]", loader: BatchLoader) -> None:
+    """Drop the data manager's parent loader once its tick is over, unless it was replaced already"""
+    data_manager = data_manager_ref()
+    if data_manager is not None and _parent_loaders.get(data_manager) is loader:
+        del _parent_loaders[data_manager]
+
+
+_UTC = timezone.utc
+
+_START_TIME_KEY = attrgetter('start_time')
+
+# Tags whose addition replaces the TOOL_CALL tag
+_TOOL_CALL_OVERRIDING_TAGS = frozenset((TaskTag.COMPLEX, TaskTag.LLM_CALL))
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO-8601 string with microseconds and a 'Z' suffix"""
+    now = datetime.now(_UTC)
+    return (
+        f"{now.year:04d}-{now.month:02d}-{now.day:02d}T"
+        f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}.{now.microsecond:06d}Z"
+    )
+
+
+def _task_ids_query(task_ids: list[str]) -> dict[str, QueryFilter]:
+    """Search query matching tasks by their task id (not element_id)"""
+    return {"id": QueryFilter(operator=QueryOperator.EQUALS_MANY, value=task_ids)}
+
+
+@lru_cache(maxsize=1024)
+def _id_suffix(name: str) -> str:
+    """Normalized name used as the suffix of default metric/issue element ids"""
+    return name.lower().replace(' ', '-')
 
 
 class TaskComposite(ElementComposite[TaskData]):
@@ -26,6 +74,8 @@ class TaskComposite(ElementComposite[TaskData]):
 
     def __init__(self, data_manager: "DataManager", task_data: TaskData,*, _token: object = None):
         super().__init__(data_manager, task_data, _token=_token)
+        # Resolved executor/parent composites, keyed by (relation, referenced id)
+        self._relation_cache: dict[tuple[str, str], Any] = {}
 
     #Factory method for creating logical Task objects
     #TODO: the parent and action - perhaps need to receive actual Elements instead ids?  Perhaps should support both?
@@ -47,7 +97,7 @@ class TaskComposite(ElementComposite[TaskData]):
                log_reference: dict[str, Any] ,
                metrics: dict[str, Any],
                parent_id: str | None=None,
-               dependent_ids: list[str]=[],
+               dependent_ids: list[str] | None = None,
                graph_id: str | None=None,
                end_time: datetime | None=None,
                parent_name: str | None = None,
@@ -61,20 +111,12 @@ class TaskComposite(ElementComposite[TaskData]):
         Returns:
             A new Task instance
         """
-        root_id = None
-        if root is not None:
-            if isinstance(root, ElementComposite):
-                root_id = root.element_id
-            elif isinstance(root, str):
-                root_id = root
-            else:
-                raise TypeError("root must be either an Element object or a string ID")
         # Create a new task data object
         task_data = TaskData(
             id=id,
             element_id=element_id,
             name=name,
-            root_id=root_id,
+            root_id=_get_root_id(root),
             plugin_metadata_id=plugin_metadata_id,
             tags=tags,
             input=input,
@@ -88,7 +130,7 @@ class TaskComposite(ElementComposite[TaskData]):
             events=events,
             metrics=metrics,
             parent_id=parent_id,
-            dependent_ids=dependent_ids,
+            dependent_ids=dependent_ids or [],
             graph_id=graph_id,
             parent_name=parent_name,
             action_id=action_id
@@ -158,30 +200,60 @@ class TaskComposite(ElementComposite[TaskData]):
     @property
     async def executor(self) -> Any | None:
         # Retrieve the Runable element that executes the task.
-        if self._data_object.action_id:
-            return await ActionComposite.get_by_id(self._data_manager,self._data_object.action_id)
+        action_id = self._data_object.action_id
+        if action_id:
+            key = ('executor', action_id)
+            if key not in self._relation_cache:
+                self._relation_cache[key] = await ActionComposite.get_by_id(self._data_manager, action_id)
+            return self._relation_cache[key]
         return None
 
 
     @property
     async def parent(self) -> 'TaskComposite | None':
-        if self._data_object.parent_id:
-            query = {
-                "id": QueryFilter(operator=QueryOperator.EQUAL, value=self._data_object.parent_id)
-            }
-
-            composites = await self._data_manager.search(
-                element_type=TaskComposite,
-                query=query
-            )
-            if composites:
-                return composites[0]
+        parent_id = self._data_object.parent_id
+        if parent_id:
+            key = ('parent', parent_id)
+            if key not in self._relation_cache:
+                self._relation_cache[key] = await self._parent_loader(self._data_manager).load(parent_id)
+            return self._relation_cache[key]
         return None
         # # Retrieve the Task composite element that represents the parent.
         # if self._data_object.parent_id:
         #     return await TaskComposite.get_by_id(self._data_manager,self._data_object.parent_id)
         # return None
 
+    def refresh(self) -> None:
+        """Drop the cached executor and parent so the next access re-reads them from the store"""
+        self._relation_cache.clear()
+
+    @staticmethod
+    def _parent_loader(data_manager: "DataManager") -> BatchLoader[str, 'TaskComposite']:
+        """
+        Get the parent loader bound to the given data manager.
+
+        Parent lookups awaited concurrently (e.g. while rendering a task hierarchy)
+        are resolved by a single search on the task ids instead of one search per task.
+        A loader serves the lookups of one event loop tick only - later lookups get a
+        new loader, so no loader outlives the batch it was created for.
+        """
+        loader = _parent_loaders.get(data_manager)
+        if loader is None:
+            # Hold the data manager weakly so the cache entry does not keep it alive
+            data_manager_ref = weakref.ref(data_manager)
+
+            async def load_parents(parent_ids: list[str]) -> dict[str, 'TaskComposite']:
+                composites = await data_manager_ref().search(
+                    element_type=TaskComposite,
+                    query=_task_ids_query(parent_ids)
+                )
+                return {composite.id: composite for composite in composites}
+
+            loader = BatchLoader(load_parents)
+            _parent_loaders[data_manager] = loader
+            asyncio.get_running_loop().call_soon(_forget_parent_loader, data_manager_ref, loader)
+        return loader
+
     @property
     def metrics(self) -> dict[str, Any] | None:
         return self._data_object.metrics
@@ -239,13 +311,14 @@ class TaskComposite(ElementComposite[TaskData]):
         Returns:
             The created Metric
         """
+        element_id = self.element_id
         if metric.root is None:
                 metric.root = self
         if not metric.element_id:
-                metric.element_id = f"metric-{self.element_id}-{metric.name.lower().replace(' ', '-')}"
+                metric.element_id = f"metric-{element_id}-" + _id_suffix(metric.name)
 
         # Add this task to related_to if not already there
-        if not any(getattr(related, 'element_id', None) == self.element_id for related in metric.related_to):
+        if element_id not in {getattr(related, 'element_id', None) for related in metric.related_to}:
                 metric.related_to.append(self)
 
         # Build and return the metric
@@ -261,55 +334,37 @@ class TaskComposite(ElementComposite[TaskData]):
         Returns:
             List of created Metric objects
         """
+        element_id = self.element_id
+        id_prefix = f"Metric-{element_id}-"
+
         # Set default values for all metrics if not provided
         for metric in metrics:
             if metric.root is None:
                 metric.root = self
             if not metric.element_id:
-                metric.element_id = f"Metric-{self.element_id}-{metric.name.lower().replace(' ', '-')}"
+                metric.element_id = id_prefix + _id_suffix(metric.name)
 
-            # Add this task to related_to if not already there
-            if not any(getattr(related, 'element_id', None) == self.element_id for related in metric.related_to):
-                metric.related_to.append(self)
+            # Add this task to related_to if not already there - freshly built
+            # metrics have no relations yet, so the id set is only built when needed
+            related_to = metric.related_to
+            if not related_to or element_id not in {getattr(related, 'element_id', None) for related in related_to}:
+                related_to.append(self)
 
-        # Use the appropriate bulk_store method based on the first metric's type
-        # Note: All metrics in the list should be of the same type
         if not metrics:
             return []
 
-        # Determine which bulk_store method to use based on the first metric's type
-        first_metric = metrics[0]
-        metric_type = first_metric.metric_type
-
         # Group metrics by their type
-        numeric_metrics = []
-        string_metrics = []
-        distribution_metrics = []
-
+        metrics_by_type: defaultdict[MetricType, list[BaseMetric]] = defaultdict(list)
         for metric in metrics:
-            if metric.metric_type == MetricType.NUMERIC:
-                numeric_metrics.append(metric)
-            elif metric.metric_type == MetricType.STRING:
-                string_metrics.append(metric)
-            elif metric.metric_type == MetricType.DISTRIBUTION:
-                distribution_metrics.append(metric)
-
-        # Store metrics of each type using the appropriate bulk_store method
-        result_metrics = []
-
-        if numeric_metrics:
-            from agent_analytics.core.data_composite.metric import BaseNumericMetric
-            result_metrics.extend(await BaseNumericMetric.bulk_store(self._data_manager, numeric_metrics))
-
-        if string_metrics:
-            from agent_analytics.core.data_composite.metric import BaseStringMetric
-            result_metrics.extend(await BaseStringMetric.bulk_store(self._data_manager, string_metrics))
+            metrics_by_type[metric.metric_type].append(metric)
 
-        if distribution_metrics:
-            from agent_analytics.core.data_composite.metric import BaseDistributionMetric
-            result_metrics.extend(await BaseDistributionMetric.bulk_store(self._data_manager, distribution_metrics))
+        # Store metrics of each type concurrently using the appropriate bulk_store method
+        stored_metrics = await asyncio.gather(*(
+            METRIC_BUILDER_CLASSES[metric_type].bulk_store(self._data_manager, type_metrics)
+            for metric_type, type_metrics in metrics_by_type.items()
+        ))
 
-        return result_metrics
+        return list(chain.from_iterable(stored_metrics))
 
     async def add_issue(self, issue: BaseIssue) -> IssueComposite:
         """
@@ -321,14 +376,16 @@ class TaskComposite(ElementComposite[TaskData]):
         Returns:
             The created Issue
         """
+        element_id = self.element_id
+
         # Set default values if not provided
         if issue.root is None:
             issue.root = self
         if not issue.element_id:
-            issue.element_id = f"Issue-{self.element_id}-{issue.name.lower().replace(' ', '-')}"
+            issue.element_id = f"Issue-{element_id}-" + _id_suffix(issue.name)
 
         # Add this task to related_to if not already there
-        if not any(getattr(related, 'element_id', None) == self.element_id for related in issue.related_to):
+        if element_id not in {getattr(related, 'element_id', None) for related in issue.related_to}:
             issue.related_to.append(self)
 
         # Build and return the issue
@@ -344,16 +401,21 @@ class TaskComposite(ElementComposite[TaskData]):
         Returns:
             List of created Issue objects
         """
+        element_id = self.element_id
+        id_prefix = f"Issue-{element_id}-"
+
         # Set default values for all issues if not provided
         for issue in issues:
             if issue.root is None:
                 issue.root = self
             if not issue.element_id:
-                issue.element_id = f"Issue-{self.element_id}-{issue.name.lower().replace(' ', '-')}"
+                issue.element_id = id_prefix + _id_suffix(issue.name)
 
-            # Add this task to related_to if not already there
-            if not any(getattr(related, 'element_id', None) == self.element_id for related in issue.related_to):
-                issue.related_to.append(self)
+            # Add this task to related_to if not already there - freshly built
+            # issues have no relations yet, so the id set is only built when needed
+            related_to = issue.related_to
+            if not related_to or element_id not in {getattr(related, 'element_id', None) for related in related_to}:
+                related_to.append(self)
 
         # Use the bulk_store method to store all issues at once
         return await BaseIssue.bulk_store(self._data_manager, issues)
@@ -366,7 +428,23 @@ class HierarchicalTask(Task):
     before creating an immutable Task logical object.
     """
     id: str = Field(description='') 
-    model_config = {"arbitrary_types_allowed": True}
+    # Unknown keyword arguments are dropped rather than kept in __pydantic_extra__,
+    # and assignments done while building the tree are not re-validated
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        extra='ignore',
+        validate_assignment=False
+    )
+
+    # Maximum number of tasks sent to the data manager in a single bulk_store call
+    BULK_STORE_CHUNK_SIZE: ClassVar[int] = 500
+    # Maximum number of chunks stored concurrently by bulk_store
+    BULK_STORE_CONCURRENCY: ClassVar[int] = 8
+
+    # Compatibility constant for BaseTask.Tag.BASIC_TAGS
+    BASIC_TAGS: ClassVar[tuple[TaskTag, ...]] = (
+        TaskTag.LLM_CALL, TaskTag.COMPLEX, TaskTag.TOOL_CALL, TaskTag.DB_CALL
+    )
 
     # ---Additional platform fields
     plugin_metadata_id: str | None = Field(
@@ -410,15 +488,10 @@ class HierarchicalTask(Task):
     def set_status(self, status: TaskStatus):
         self.status = status
         if status in [TaskStatus.CREATED, TaskStatus.RUNNING]:
-            self.start_time = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f") + 'Z'
+            self.start_time = _utc_timestamp()
         else:
-            self.end_time = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%f") + 'Z'
+            self.end_time = _utc_timestamp()
 
-    @property
-    def BASIC_TAGS(self) -> List[str]:
-        """Compatibility property for BaseTask.Tag.BASIC_TAGS"""
-        return [TaskTag.LLM_CALL, TaskTag.COMPLEX, TaskTag.TOOL_CALL, TaskTag.DB_CALL]
-    
     def add_tag(self, tags: List[str]) -> None:
         """
         Add tags to the task with special logic for COMPLEX and LLM_CALL tags.
@@ -429,11 +502,12 @@ class HierarchicalTask(Task):
             self.tags = []
         
         # Special logic: if COMPLEX or LLM_CALL is added, remove TOOL_CALL
-        if TaskTag.COMPLEX in tags or TaskTag.LLM_CALL in tags:
+        if not _TOOL_CALL_OVERRIDING_TAGS.isdisjoint(tags):
             self.remove_tag([TaskTag.TOOL_CALL])
         
-        # Add new tags (avoiding duplicates)
-        self.tags = list(set(self.tags + tags))
+        # Add new tags (avoiding duplicates, keeping insertion order). The list is rebuilt
+        # rather than appended to, as it may be shared with other objects.
+        self.tags = list(dict.fromkeys([*self.tags, *tags]))
     
     def remove_tag(self, tags: List[str]) -> None:
         """
@@ -454,54 +528,41 @@ class HierarchicalTask(Task):
         return cls(**data)
 
     @classmethod
-    def from_json(cls, json_str: str) -> 'HierarchicalTask':
-        """Create a builder from a JSON string"""
-        import json
-        data = json.loads(json_str)
+    def from_json(cls, json_str: str | bytes) -> 'HierarchicalTask':
+        """Create a builder from a JSON string or UTF-8 encoded bytes"""
+        data = json_loads(json_str)
         return cls.from_dict(data)
 
     def flatten(self) -> 'HierarchicalTask':
         """
         Creates a new HierarchicalTask instance with relationship IDs calculated and preserved
         but without the deep nested fields to reduce memory usage.
+
+        The copy skips validation. Its tags, attributes, events and metadata are copies of
+        this task's containers, so later in-place updates of the task (add_tag, attribute
+        writes of the span processors) don't leak into the flattened snapshot.
         
         Returns:
             A new HierarchicalTask instance with flattened structure
         """
-        # Extract base task fields directly
-        base_fields = {
-            # Task fields
-            'id': self.id,
-            'name': self.name,
-            'tags': self.tags if self.tags is not None else [],
-            'input': self.input if self.input is not None else {},
-            'output': self.output if self.output is not None else {},
-            'log_reference': self.log_reference,
-            'status': self.status,
-            'attributes': self.attributes if self.attributes is not None else {},
-            'metadata': self.metadata if self.metadata is not None else {},
-            'start_time': self.start_time,
-            'end_time': self.end_time,
-            'events': self.events if self.events is not None else [],
-
-            # HierarchicalTask additional fields (excluding nested structures)
-            'element_id': self.element_id,
-            'plugin_metadata_id': self.plugin_metadata_id,
-            'action_id': self.action_id,
-            'prefix': self.prefix,
-            'root_id': self.root_id,
+        return self.model_copy(update={
+            # Drop the nested structures
+            'parent': None,
+            'children': [],
+            'dependees': [],
+            'dependent': [],
+            'children_node_graph': None,
 
             # Calculate relationship IDs explicitly
             'parent_id': self.parent.id if self.parent else None,
-            'dependent_ids': [dep.id for dep in self.dependent]
+            'dependent_ids': [dep.id for dep in self.dependent],
 
-            # input_resource_ids and created_resource_ids are commented out in original code
-            # 'input_resource_ids': self.input_resource_ids.copy() if self.input_resource_ids else None,
-            # 'created_resource_ids': self.created_resource_ids.copy() if self.created_resource_ids else None,
-        }
-
-        # Create a new instance with just the fields we need
-        return HierarchicalTask(**base_fields)
+            # Own copies of the containers that are updated in place
+            'tags': list(self.tags) if self.tags is not None else None,
+            'attributes': dict(self.attributes) if self.attributes is not None else None,
+            'events': list(self.events) if self.events is not None else None,
+            'metadata': dict(self.metadata) if self.metadata is not None else None,
+        })
 
     async def store(self, data_manager: "DataManager") -> TaskComposite:
         """
@@ -548,65 +609,86 @@ class HierarchicalTask(Task):
 
 
     @classmethod
-    async def bulk_store(cls, data_manager: "DataManager", tasks: list['HierarchicalTask']) -> list[TaskComposite]:
+    async def bulk_store(cls,
+                         data_manager: "DataManager",
+                         tasks: list['HierarchicalTask'],
+                         max_concurrency: int | None = None) -> list[TaskComposite]:
         """
         Efficiently store multiple HierarchicalTask objects at once.
+
+        Tasks are split into chunks of BULK_STORE_CHUNK_SIZE which are built and stored
+        concurrently, so building one chunk overlaps with the store round-trip of another.
+        At most max_concurrency chunks are in flight at a time, so large forests do not
+        exhaust the connections of the underlying store.
         
         Args:
             data_manager: The data manager to use for storage
             tasks: List of HierarchicalTask objects to store
+            max_concurrency: Maximum number of concurrent chunk stores,
+                             defaults to BULK_STORE_CONCURRENCY
             
         Returns:
-            List of created TaskComposite objects
-        """
-        # Create all composite objects but don't store them individually
-        composite_objects = []
-        for task in tasks:
-            # Process root information
-            root_id = None
-            if task.root_id is not None:
-                if isinstance(task.root_id, ElementComposite):
-                    root_id = task.root_id.element_id
-                elif isinstance(task.root_id, str):
-                    root_id = task.root_id
-                else:
-                    raise TypeError("root must be either an Element object or a string ID")
-
-            # Create task data
-            task_data = TaskData(
-                id=task.id,
-                element_id=task.element_id,
-                name=task.name,
-                root_id=root_id,
-                plugin_metadata_id=task.plugin_metadata_id,
-                tags=task.tags,
-                input=task.input,
-                output=task.output,
-                status=task.status,
-                attributes=task.attributes,
-                metadata=task.metadata,
-                start_time=task.start_time,
-                end_time=task.end_time,
-                events=task.events,
-                #metrics=task.metrics,
-                parent_id=task.parent_id,
-                dependent_ids=task.dependent_ids,
-                log_reference=task.log_reference,
-                # input_resource_ids=task.input_resource_ids,
-                # created_resource_ids=task.created_resource_ids,
-                action_id=task.action_id
-            )
-
-            # Create task instance without storing it
-            composite = TaskComposite(data_manager, task_data, _token=_CREATION_TOKEN)
-            composite_objects.append(composite)
+            List of created TaskComposite objects, in the order of the input tasks
+        """
+        if not tasks:
+            return []
+
+        chunk_size = cls.BULK_STORE_CHUNK_SIZE
+        chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+        if len(chunks) == 1:
+            return await cls._store_chunk(data_manager, chunks[0])
+
+        # Created per call - a semaphore is bound to the event loop it is first used in
+        semaphore = asyncio.Semaphore(max_concurrency or cls.BULK_STORE_CONCURRENCY)
+
+        async def store_chunk(chunk: list['HierarchicalTask']) -> list[TaskComposite]:
+            async with semaphore:
+                return await cls._store_chunk(data_manager, chunk)
+
+        stored_chunks = await asyncio.gather(*(store_chunk(chunk) for chunk in chunks))
+
+        # Return the created composite objects
+        return [composite for stored_chunk in stored_chunks for composite in stored_chunk]
+
+    @classmethod
+    async def _store_chunk(cls, data_manager: "DataManager", tasks: list['HierarchicalTask']) -> list[TaskComposite]:
+        """Build the composite objects for a chunk of tasks and store them with one bulk call"""
+        composite_objects = [
+            TaskComposite(data_manager, task._build_task_data(), _token=_CREATION_TOKEN)
+            for task in tasks
+        ]
 
         # Use the bulk_store method of the data manager
         await data_manager.bulk_store(composite_objects)
 
-        # Return the created composite objects
         return composite_objects
 
+    def _build_task_data(self) -> TaskData:
+        """Create the persistent TaskData for this task"""
+        return TaskData(
+            id=self.id,
+            element_id=self.element_id,
+            name=self.name,
+            root_id=_get_root_id(self.root_id),
+            plugin_metadata_id=self.plugin_metadata_id,
+            tags=self.tags,
+            input=self.input,
+            output=self.output,
+            status=self.status,
+            attributes=self.attributes,
+            metadata=self.metadata,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            events=self.events,
+            #metrics=self.metrics,
+            parent_id=self.parent_id,
+            dependent_ids=self.dependent_ids,
+            log_reference=self.log_reference,
+            # input_resource_ids=self.input_resource_ids,
+            # created_resource_ids=self.created_resource_ids,
+            action_id=self.action_id
+        )
+
 
 class HierarchicalTaskNamingUtils:
     """
@@ -616,18 +698,27 @@ class HierarchicalTaskNamingUtils:
     @classmethod
     def assign_hierarchical_prefixes(cls, tasks: list[HierarchicalTask]) -> None:
         """
-        Assign hierarchical prefixes to a list of root tasks.
+        Assign hierarchical prefixes to a list of root tasks and all their descendants.
+
+        The hierarchy is walked with an explicit stack, so deep trees do not hit
+        the interpreter recursion limit.
 
         Args:
             tasks: List of root tasks to assign prefixes to
         """
-        for i, task in enumerate(tasks):
-            cls._assign_task_prefix(task, str(i))
+        stack = [(task, str(i)) for i, task in enumerate(tasks)]
+        while stack:
+            task, prefix = stack.pop()
+            cls._assign_task_prefix(task, prefix)
+
+            # Sort children by start time to ensure consistent ordering
+            sorted_children = sorted(task.children, key=_START_TIME_KEY)
+            stack.extend((child, f"{prefix}.{i}") for i, child in enumerate(sorted_children))
 
     @classmethod
     def _assign_task_prefix(cls, task: HierarchicalTask, prefix: str) -> None:
         """
-        Recursively assign a prefix to a task and its children.
+        Assign a prefix to a single task.
 
         Args:
             task: The task to assign a prefix to
@@ -639,10 +730,3 @@ class HierarchicalTaskNamingUtils:
         # Only update name if it doesn't already have a prefix
         if ":" not in task.name:
             task.name = f"{prefix}:{task.name}"
-
-        # Sort children by start time to ensure consistent ordering
-        sorted_children = sorted(task.children, key=lambda t: t.start_time)
-
-        # Recursively assign prefixes to children
-        for i, child in enumerate(sorted_children):
-            cls._assign_task_prefix(child, f"{prefix}.{i}")
@@ -1,14 +1,29 @@
-import json
-import uuid
-from typing import Any, ClassVar
+import sys
+from collections.abc import AsyncIterator
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, ClassVar
+from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from agent_analytics.core.data.base_data_manager import DataManager
 from agent_analytics.core.data.trace_group_data import TraceGroupData
 from agent_analytics.core.data_composite.base_trace import BaseTraceComposite
-from agent_analytics.core.data_composite.element import _CREATION_TOKEN, ElementComposite
-from agent_analytics.core.data_composite.metric import MetricComposite
+from agent_analytics.core.data_composite.element import (
+    _CREATION_TOKEN,
+    ElementComposite,
+    _get_root_id,
+)
+from agent_analytics.core.utilities.batch_writer import BatchWriter
+from agent_analytics.core.utilities.json_utils import json_loads
+
+if TYPE_CHECKING:
+    from agent_analytics.core.data_composite.metric import MetricComposite
+
+
+def _trace_group_id(service_name: str) -> str:
+    """Generate a trace group element id, in the same shape for the factory and the builders"""
+    return f"trace-group-{service_name}-{uuid4()}"
 
 
 class TraceGroupComposite(ElementComposite[TraceGroupData]):
@@ -25,38 +40,39 @@ class TraceGroupComposite(ElementComposite[TraceGroupData]):
     def __init__(self, data_manager: DataManager, trace_group_data: TraceGroupData,*, _token: object = None):
         super().__init__(data_manager, trace_group_data, _token=_token)
 
-    # Basic properties that reflect the underlying data object
+    # Basic properties that reflect the underlying data object.
+    # The data object is never replaced, so these are resolved once per composite.
 
     @classmethod
     async def get_trace_groups(cls,data_manager: "DataManager",service_name: str) -> list['TraceGroupComposite']:
         return await data_manager.get_trace_groups(service_name)
 
-    @property
+    @cached_property
     def service_name(self) -> str:
         """Get the service name this trace group belongs to"""
         return self._data_object.service_name
 
-    @property
+    @cached_property
     def traces_ids(self) -> list[str]:
         """Get the list of trace IDs in this group"""
         return self._data_object.traces_ids
 
-    @property
+    @cached_property
     def avg_duration(self) -> float | None:
         """Get the average duration across all traces in seconds"""
         return self._data_object.avg_duration
 
-    @property
+    @cached_property
     def success_rate(self) -> float | None:
         """Get the success rate across all traces (0.0 to 1.0)"""
         return self._data_object.success_rate
 
-    @property
+    @cached_property
     def total_traces(self) -> int:
         """Get the total number of traces in the group"""
         return self._data_object.total_traces
 
-    @property
+    @cached_property
     def failure_count(self) -> int:
         """Get the number of failed traces"""
         return self._data_object.failure_count
@@ -73,7 +89,7 @@ class TraceGroupComposite(ElementComposite[TraceGroupData]):
         return await self._data_manager.get_traces_for_trace_group(self.element_id)
 
     @property
-    async def owned_metrics(self) -> list[MetricComposite]:
+    async def owned_metrics(self) -> list['MetricComposite']:
         """
         Get all metrics owned by this trace group.
 
@@ -83,10 +99,25 @@ class TraceGroupComposite(ElementComposite[TraceGroupData]):
         Returns:
             List of MetricComposite objects owned by this trace group
         """
+        from agent_analytics.core.data_composite.metric import MetricComposite
         return await self._data_manager.get_children(self.element_id, MetricComposite)
 
+    async def owned_metrics_iter(self) -> AsyncIterator['MetricComposite']:
+        """
+        Iterate over the metrics owned by this trace group without materializing them all.
+
+        Metrics are fetched from the store page by page, so callers can start processing
+        the first metrics while the next ones are still being retrieved.
+
+        Yields:
+            MetricComposite objects owned by this trace group
+        """
+        from agent_analytics.core.data_composite.metric import MetricComposite
+        async for metric in self._data_manager.iter_children(self.element_id, MetricComposite):
+            yield metric
+
     @property
-    async def related_metrics(self) -> list[MetricComposite]:
+    async def related_metrics(self) -> list['MetricComposite']:
         """
         Get all metrics owned by this trace group.
 
@@ -96,6 +127,7 @@ class TraceGroupComposite(ElementComposite[TraceGroupData]):
         Returns:
             List of MetricComposite objects owned by this trace group
         """
+        from agent_analytics.core.data_composite.metric import MetricComposite
         related_elements = await self._data_manager.get_elements_related_to_artifact_and_type(self,MetricComposite)
         return related_elements
 
@@ -111,47 +143,10 @@ class TraceGroupComposite(ElementComposite[TraceGroupData]):
             traces_ids: List of trace IDs to compute metrics for
 
         Returns:
-            Dictionary with computed metrics: avg_duration, success_rate, total_traces, failure_count
+            Dictionary with computed metrics: avg_duration, success_rate, total_traces, failure_count,
+            and the duration spread - stddev_duration, min_duration, max_duration
         """
-        if not traces_ids:
-            return {
-                'avg_duration': None,
-                'success_rate': None,
-                'total_traces': 0,
-                'failure_count': 0
-            }
-
-        # Fetch all traces
-        durations = []
-        failure_count = 0
-
-        for trace_id in traces_ids:
-            try:
-                trace = await data_manager.get_trace(trace_id)
-
-                # Compute duration if both start_time and end_time are available
-                if trace.start_time and trace.end_time:
-                    duration = (trace.end_time - trace.start_time).total_seconds()
-                    durations.append(duration)
-
-                # Check if trace has failures
-                if trace.failures and len(trace.failures) > 0:
-                    failure_count += 1
-            except Exception:
-                # If we can't fetch a trace, skip it
-                pass
-
-        # Compute metrics
-        total_traces = len(traces_ids)
-        avg_duration = sum(durations) / len(durations) if durations else None
-        success_rate = (total_traces - failure_count) / total_traces if total_traces > 0 else None
-
-        return {
-            'avg_duration': avg_duration,
-            'success_rate': success_rate,
-            'total_traces': total_traces,
-            'failure_count': failure_count
-        }
+        return await data_manager.aggregate_trace_metrics(traces_ids)
 
     @classmethod
     async def create(cls,
@@ -180,11 +175,9 @@ class TraceGroupComposite(ElementComposite[TraceGroupData]):
             Metrics should be created separately using the MetricsResource with
             owner=trace_group and related_to=trace_group.
         """
-        import uuid
-
         # Generate ID if not provided
         if element_id is None:
-            element_id = f"trace-group-{service_name}-{uuid.uuid4()}"
+            element_id = _trace_group_id(service_name)
 
         # Set default name if not provided
         if name is None:
@@ -208,6 +201,29 @@ class TraceGroupComposite(ElementComposite[TraceGroupData]):
         # Return trace group
         return trace_group
 
+    @classmethod
+    async def create_many(cls,
+                          data_manager: DataManager,
+                          base_trace_groups: list['BaseTraceGroup']) -> list['TraceGroupComposite']:
+        """
+        Factory method to create several trace groups with a single bulk store
+
+        Args:
+            data_manager: The data manager to use for storage
+            base_trace_groups: Trace group builders to create the trace groups from
+
+        Returns:
+            The created TraceGroup instances, in the order of the builders
+        """
+        composite_objects = [
+            base_trace_group._build_composite(data_manager) for base_trace_group in base_trace_groups
+        ]
+
+        # Use the bulk_store method of the data manager
+        await data_manager.bulk_store(composite_objects)
+
+        return composite_objects
+
 
 class BaseTraceGroup(BaseModel):
     """
@@ -217,11 +233,14 @@ class BaseTraceGroup(BaseModel):
     before creating an immutable TraceGroup logical object.
     
     """
-    model_config = {"arbitrary_types_allowed": True
+    # The validation schema is built on first use instead of at import time
+    model_config = {"arbitrary_types_allowed": True,
+                    "defer_build": True
     }
 
     # --- Fields from TraceGroup ---
-    id: str = Field(default_factory=lambda: f"trace-group-{uuid.uuid4()}")
+    # Generated from the service name when not given
+    id: str = ""
     name: str | None = None
     service_name: str = ""
     traces_ids: list[str] = Field(default_factory=list)
@@ -230,15 +249,27 @@ class BaseTraceGroup(BaseModel):
     # --- Owner-related fields ---
     root: ElementComposite | str | None = None
 
+    @field_validator('service_name')
+    @classmethod
+    def intern_service_name(cls, v: str) -> str:
+        # Many builders share a handful of service names - keep one copy of each
+        return sys.intern(v)
+
+    @model_validator(mode='after')
+    def default_id(self) -> 'BaseTraceGroup':
+        if not self.id:
+            self.id = _trace_group_id(self.service_name)
+        return self
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> 'BaseTraceGroup':
         """Create a builder from a dictionary"""
         return cls(**data)
 
     @classmethod
-    def from_json(cls, json_str: str) -> 'BaseTraceGroup':
-        """Create a builder from a JSON string"""
-        data = json.loads(json_str)
+    def from_json(cls, json_str: str | bytes) -> 'BaseTraceGroup':
+        """Create a builder from a JSON string or UTF-8 encoded bytes"""
+        data = json_loads(json_str)
         return cls.from_dict(data)
 
     async def store(self, data_manager: DataManager) -> TraceGroupComposite:
@@ -250,6 +281,10 @@ class BaseTraceGroup(BaseModel):
             
         Returns:
             The created TraceGroup logical object
+
+        Note:
+            Each call is a separate store round-trip - use bulk_store when creating
+            many trace groups in a loop.
         """
         # Validate required fields
         if not self.service_name:
@@ -260,9 +295,9 @@ class BaseTraceGroup(BaseModel):
             self.name = f"Trace Group for {self.service_name}"
 
         # Prepare kwargs for additional parameters
-        kwargs = dict(self.attributes)
+        kwargs = dict(self.attributes) if self.attributes else {}
         if self.root is not None:
-            kwargs['root'] = self.root
+            kwargs['root_id'] = _get_root_id(self.root)
 
         # Create the trace group
         return await TraceGroupComposite.create(
@@ -291,44 +326,84 @@ class BaseTraceGroup(BaseModel):
             Metrics should be created separately using the MetricsResource with
             owner=trace_group and related_to=trace_group.
         """
-        # Validate all builders before proceeding
-        for base_trace_group in base_trace_groups:
-            if not base_trace_group.service_name:
-                raise ValueError(f"Service name must be set before building (id: {base_trace_group.id})")
-
-            # Set default name if not provided
-            if base_trace_group.name is None:
-                base_trace_group.name = f"Trace Group for {base_trace_group.service_name}"
-
-        # Create all composite objects but don't store them individually
-        composite_objects = []
-        for base_trace_group in base_trace_groups:
-            # Prepare kwargs for additional parameters
-            kwargs = dict(base_trace_group.attributes or {})
-
-            if base_trace_group.root is not None:
-                if isinstance(base_trace_group.root, ElementComposite):
-                    kwargs['root_id'] = base_trace_group.root.id
-                elif isinstance(base_trace_group.root, str):
-                    kwargs['root_id'] = base_trace_group.root
-                else:
-                    raise TypeError("root must be either an Element object or a string ID")
-
-            # Create trace group data without computing metrics
-            trace_group_data = TraceGroupData(
-                element_id=base_trace_group.id,
-                name=base_trace_group.name,
-                service_name=base_trace_group.service_name,
-                traces_ids=base_trace_group.traces_ids or [],
-                **kwargs
-            )
-
-            # Create trace group instance without storing it
-            composite = TraceGroupComposite(data_manager, trace_group_data, _token=_CREATION_TOKEN)
-            composite_objects.append(composite)
+        if not base_trace_groups:
+            return []
 
-        # Use the bulk_store method of the data manager
-        await data_manager.bulk_store(composite_objects)
+        # Validate and build all composite objects in a single pass, then store them with
+        # one bulk call - nothing is stored if any builder is invalid
+        return await TraceGroupComposite.create_many(data_manager, base_trace_groups)
 
-        # Return the created composite objects
-        return composite_objects
+    def _build_composite(self, data_manager: DataManager) -> TraceGroupComposite:
+        """Validate this builder and create its TraceGroup logical object without storing it"""
+        if not self.service_name:
+            raise ValueError(f"Service name must be set before building (id: {self.id})")
+
+        # Set default name if not provided
+        if self.name is None:
+            self.name = f"Trace Group for {self.service_name}"
+
+        # Prepare kwargs for additional parameters
+        kwargs = dict(self.attributes) if self.attributes else {}
+
+        if self.root is not None:
+            kwargs['root_id'] = _get_root_id(self.root)
+
+        # Create trace group data without computing metrics. Without attributes every value
+        # was already validated by this builder, so the data object is constructed directly.
+        data_factory = TraceGroupData if self.attributes else TraceGroupData.model_construct
+        trace_group_data = data_factory(
+            element_id=self.id,
+            name=self.name,
+            service_name=self.service_name,
+            traces_ids=self.traces_ids or [],
+            **kwargs
+        )
+
+        return TraceGroupComposite(data_manager, trace_group_data, _token=_CREATION_TOKEN)
+
+
+class TraceGroupBatcher:
+    """
+    Coalesces concurrent single trace group stores into bulk stores.
+
+    Builders passed to store() from concurrent callers are buffered for up to
+    window_ms milliseconds or batch_size builders and written with a single
+    BaseTraceGroup.bulk_store call.
+    """
+
+    def __init__(self, data_manager: DataManager, batch_size: int = 64, window_ms: float = 5):
+        """
+        Args:
+            data_manager: The data manager to use for storage
+            batch_size: Number of buffered builders that triggers an immediate bulk store
+            window_ms: Maximum time in milliseconds a builder waits in the buffer
+        """
+        self._data_manager = data_manager
+        self._writer: BatchWriter[BaseTraceGroup, TraceGroupComposite] = BatchWriter(
+            self._bulk_store,
+            max_batch=batch_size,
+            max_delay=window_ms / 1000
+        )
+
+    async def store(self, base_trace_group: BaseTraceGroup) -> TraceGroupComposite:
+        """
+        Store a trace group as part of the next bulk store.
+
+        Args:
+            base_trace_group: The trace group builder to store
+
+        Returns:
+            The created TraceGroup logical object
+        """
+        # Validate before buffering so an invalid builder does not fail the whole batch
+        if not base_trace_group.service_name:
+            raise ValueError(f"Service name must be set before building (id: {base_trace_group.id})")
+
+        return await self._writer.submit(base_trace_group)
+
+    async def flush(self) -> None:
+        """Store all buffered trace groups now"""
+        await self._writer.flush()
+
+    async def _bulk_store(self, base_trace_groups: list[BaseTraceGroup]) -> list[TraceGroupComposite]:
+        return await BaseTraceGroup.bulk_store(self._data_manager, base_trace_groups)
@@ -1,12 +1,15 @@
+import asyncio
 import json
 import uuid
+from collections.abc import Callable
+from operator import attrgetter
 from typing import Any, ClassVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from agent_analytics.core.data.trace_workflow_data import TraceWorkflowData
 from agent_analytics.core.data_composite.action import ActionComposite
-from agent_analytics.core.data_composite.element import _CREATION_TOKEN, ElementComposite
+from agent_analytics.core.data_composite.element import _CREATION_TOKEN, ElementComposite, _get_root_id
 from agent_analytics.core.data_composite.metric import MetricComposite
 from agent_analytics.core.data_composite.workflow import BaseWorkflow, WorkflowComposite
 from agent_analytics.core.data_composite.workflow_edge import (
@@ -19,14 +22,97 @@ from agent_analytics.core.data_composite.workflow_node import (
 )
 from agent_analytics.core.data_composite.workflow_node_gateway import BaseWorkflowNodeGateway
 
+# Reads element_id at C speed in map() over builders and composites
+_element_id = attrgetter('element_id')
+
+# Action ID getters by concrete type, the isinstance checks run once per type
+_ACTION_ID_GETTERS: dict[type, Callable[[Any], str]] = {
+    str: lambda action: action,
+    ActionComposite: _element_id,
+}
+
+
+def _action_id(action: ActionComposite | str) -> str:
+    """Normalize an action reference to its ID"""
+    getter = _ACTION_ID_GETTERS.get(type(action))
+    if getter is None:
+        if isinstance(action, ActionComposite):
+            getter = _element_id
+        elif isinstance(action, str):
+            getter = str
+        else:
+            raise TypeError("actions must be either ActionComposite objects or string IDs")
+        _ACTION_ID_GETTERS[type(action)] = getter
+    return getter(action)
+
+
+def _split_refs(items: list) -> tuple[list[str], list]:
+    """Split sub-objects into the IDs of already stored ones (IDs or composites) and the builders to store"""
+    refs = []
+    builders = []
+    for item in items:
+        if isinstance(item, str):
+            refs.append(item)
+        elif isinstance(item, ElementComposite):
+            refs.append(item.element_id)
+        else:
+            builders.append(item)
+    return refs, builders
+
+
+# Builder fields of sub-objects with the fields holding the IDs of their already stored counterparts
+_REF_FIELDS = (
+    ('workflows', 'workflow_refs'),
+    ('workflow_nodes', 'workflow_node_refs'),
+    ('workflow_edges', 'workflow_edge_refs'),
+)
+
+
+async def _get_by_ids_in_order(data_manager: "DataManager", element_ids: list[str], element_type: type) -> list:
+    """Fetch elements with a single batched query, in the order of element_ids (None where missing)"""
+    found = {
+        element.element_id: element
+        for element in await data_manager.get_by_ids(element_ids, element_type)
+    }
+    return [found.get(element_id) for element_id in element_ids]
+
+
+async def _bulk_store_if_any(builder_class: type, data_manager: "DataManager", builders: list) -> list:
+    """Bulk store the builders not stored yet with the given builder class, skipping the call if there are none"""
+    if not builders:
+        return []
+    # Builders shared across trace workflows are written only once per data manager
+    new_builders = [builder for builder in builders if not builder._is_stored_in(data_manager)]
+    if not new_builders:
+        return []
+    return await builder_class.bulk_store(data_manager, new_builders)
+
+
+async def _bulk_store_sub_objects(data_manager: "DataManager",
+                                  workflows: list,
+                                  workflow_nodes: list,
+                                  workflow_edges: list) -> tuple[list, list, list]:
+    """Bulk store workflows, workflow nodes and workflow edges concurrently - they are independent"""
+    if not (workflows or workflow_nodes or workflow_edges):
+        return [], [], []
+    return await asyncio.gather(
+        _bulk_store_if_any(BaseWorkflow, data_manager, workflows),
+        _bulk_store_if_any(BaseWorkflowNode, data_manager, workflow_nodes),
+        _bulk_store_if_any(BaseWorkflowEdge, data_manager, workflow_edges),
+    )
+
 
 class TraceWorkflowComposite(ElementComposite[TraceWorkflowData]):
     """Composite representation of a Task with related Metrics"""
     # Specify the corresponding data class
     data_class: ClassVar[type[TraceWorkflowData]] = TraceWorkflowData
 
+    __slots__ = ('_relation_cache',)
+
     def __init__(self, data_manager: "DataManager", base_workflow_data: TraceWorkflowData,*, _token: object = None):
         super().__init__(data_manager, base_workflow_data, _token=_token)
+        # Resolved relations keyed by relation name, stored with the id tuple they were resolved for
+        self._relation_cache: dict[str, tuple[tuple[str, ...], list]] = {}
 
 
     # Basic properties that reflect the underlying data object
@@ -41,53 +127,40 @@ class TraceWorkflowComposite(ElementComposite[TraceWorkflowData]):
         """Get the list of workflow objects"""
         return self._data_object.workflows
 
-    @property
     async def workflows(self)->list[WorkflowComposite]:
         """
         Get all workflows in this trace workflow
         
         Returns a list of logical Workflow objects corresponding to the workflow_ids in this object
         """
-        workflows_list = []
-        for workflow in self._data_object.workflows:
-            workflows_list.append(await self._data_manager.get_by_id(workflow,WorkflowComposite))
-        return workflows_list
+        return await self._get_related('workflows', self._data_object.workflows, WorkflowComposite)
 
     @property
     def workflows_nodes_ids(self) -> list[str]:
         """Get the list of workflow nodes objects"""
         return self._data_object.workflow_nodes
 
-    @property
     async def workflow_nodes(self) -> list[WorkflowNodeComposite]:
         """
         Get all workflow nodes in this trace workflow
         
         Returns a list of logical WorkflowNode objects corresponding to the workflow_node_ids in this object
         """
-        workflows_nodes_list = []
-        for workflow_node in self._data_object.workflow_nodes:
-            workflows_nodes_list.append(await self._data_manager.get_by_id(workflow_node,WorkflowNodeComposite))
-        return workflows_nodes_list
+        return await self._get_related('workflow_nodes', self._data_object.workflow_nodes, WorkflowNodeComposite)
 
-    @property
     async def workflow_edges(self) -> list[WorkflowEdgeComposite]:
         """
         Get all workflow nodes in this trace workflow
         
         Returns a list of logical WorkflowNode objects corresponding to the workflow_node_ids in this object
         """
-        workflows_edge_list = []
-        for workflow_edge in self._data_object.workflow_edges:
-            workflows_edge_list.append(await self._data_manager.get_by_id(workflow_edge,WorkflowEdgeComposite))
-        return workflows_edge_list
+        return await self._get_related('workflow_edges', self._data_object.workflow_edges, WorkflowEdgeComposite)
 
     @property
     def workflow_edges_ids(self) -> list[str]:
         """Get the list of workflow edge objects"""
         return self._data_object.workflow_edges
 
-    @property
     async def metrics(self) -> list[MetricComposite]:
         """
         Get all metrics related to this workflow node.
@@ -101,7 +174,7 @@ class TraceWorkflowComposite(ElementComposite[TraceWorkflowData]):
     @classmethod
     async def get_metrics_workflow(cls, data_manager, workflow_id):
         workflow = await data_manager.get_by_id(workflow_id, TraceWorkflowComposite)
-        metrics = await workflow.metrics
+        metrics = await workflow.metrics()
         return metrics
 
     # Relationship properties that use the data manager
@@ -112,10 +185,21 @@ class TraceWorkflowComposite(ElementComposite[TraceWorkflowData]):
         
         Returns a list of logical Action objects corresponding to the actions IDs in this workflow.
         """
-        actions_list = []
-        for action in self._data_object.actions:
-            actions_list.append(await self._data_manager.get_by_id(action,ActionComposite))
-        return actions_list
+        return await self._get_related('actions', self._data_object.actions, ActionComposite)
+
+    async def _get_related(self, relation: str, element_ids: list[str], element_type: type) -> list:
+        """Resolve a relation once per id list, re-fetching only if the ids changed"""
+        signature = tuple(element_ids)
+        cached = self._relation_cache.get(relation)
+        if cached is None or cached[0] != signature:
+            cached = (signature, await _get_by_ids_in_order(self._data_manager, element_ids, element_type))
+            self._relation_cache[relation] = cached
+        # Hand out a copy so callers can't alter the cached list
+        return list(cached[1])
+
+    def refresh(self) -> None:
+        """Drop the cached relations so the next access re-reads them from the store"""
+        self._relation_cache.clear()
 
     @classmethod
     async def create(cls,
@@ -124,9 +208,9 @@ class TraceWorkflowComposite(ElementComposite[TraceWorkflowData]):
                     name: str,
                     description: str,
                     actions: list[ActionComposite | str] | None = None,
-                    workflows: list[BaseWorkflow] | None = None,
-                    workflow_nodes: list[BaseWorkflowNode] | None = None,
-                    workflow_edges: list[BaseWorkflowEdge] | None = None,
+                    workflows: list[BaseWorkflow | WorkflowComposite | str] | None = None,
+                    workflow_nodes: list[BaseWorkflowNode | WorkflowNodeComposite | str] | None = None,
+                    workflow_edges: list[BaseWorkflowEdge | WorkflowEdgeComposite | str] | None = None,
                     root: ElementComposite | str | None = None,
                     **kwargs) -> 'TraceWorkflowComposite':
         """
@@ -138,52 +222,31 @@ class TraceWorkflowComposite(ElementComposite[TraceWorkflowData]):
             name: The name of the trace workflow
             description: A description of the trace workflow
             actions: List of actions to include in the workflow
-            workflows: List of workflow objects to include
-            workflow_nodes: List of workflow node objects to include
-            workflow_edges: List of workflow edge objects to include
+            workflows: List of workflow objects to include, either builders or already stored ones (composites or IDs)
+            workflow_nodes: List of workflow node objects to include, either builders or already stored ones
+            workflow_edges: List of workflow edge objects to include, either builders or already stored ones
             root: The root element for this trace workflow
             **kwargs: Additional attributes for the trace workflow
             
         Returns:
             A new TraceWorkflowComposite instance
         """
-        root_id = None
-        if root is not None:
-            if isinstance(root, ElementComposite):
-                root_id = root.element_id
-            elif isinstance(root, str):
-                root_id = root
-            else:
-                raise TypeError("root must be either an Element object or a string ID")
+        root_id = _get_root_id(root)
 
         # Process actions IDs
-        actions_ids = []
-        if actions:
-            for action in actions:
-                if isinstance(action, ActionComposite):
-                    actions_ids.append(action.element_id)
-                elif isinstance(action, str):
-                    actions_ids.append(action)
-                else:
-                    raise TypeError("actions must be either ActionComposite objects or string IDs")
-
-        # Bulk store workflow builder objects and collect their IDs
-        workflow_ids = []
-        if workflows:
-            stored_workflows = await BaseWorkflow.bulk_store(data_manager, workflows)
-            workflow_ids = [wf.element_id for wf in stored_workflows]
-
-        # Bulk store workflow node builder objects and collect their IDs
-        workflow_node_ids = []
-        if workflow_nodes:
-            stored_workflow_nodes = await BaseWorkflowNode.bulk_store(data_manager, workflow_nodes)
-            workflow_node_ids = [wn.element_id for wn in stored_workflow_nodes]
-
-        # Bulk store workflow edge builder objects and collect their IDs
-        workflow_edge_ids = []
-        if workflow_edges:
-            stored_workflow_edges = await BaseWorkflowEdge.bulk_store(data_manager, workflow_edges)
-            workflow_edge_ids = [we.element_id for we in stored_workflow_edges]
+        actions_ids = list(map(_action_id, actions)) if actions else []
+
+        # Already stored sub-objects are referenced by ID only
+        workflow_ids, workflows = _split_refs(workflows or [])
+        workflow_node_ids, workflow_nodes = _split_refs(workflow_nodes or [])
+        workflow_edge_ids, workflow_edges = _split_refs(workflow_edges or [])
+
+        # Bulk store the workflow, workflow node and workflow edge builder objects that were not stored yet.
+        # The IDs come from the builders, which keep them when stored.
+        await _bulk_store_sub_objects(data_manager, workflows, workflow_nodes, workflow_edges)
+        workflow_ids.extend(map(_element_id, workflows))
+        workflow_node_ids.extend(map(_element_id, workflow_nodes))
+        workflow_edge_ids.extend(map(_element_id, workflow_edges))
 
         # Create trace workflow data
         trace_workflow_data = TraceWorkflowData(
@@ -218,7 +281,8 @@ class BaseTraceWorkflow(BaseModel):
     This class provides a mutable interface that can be used to gather data
     before creating an immutable TraceWorkflowComposite logical object.
     """
-    model_config = {"arbitrary_types_allowed": True}
+    # The validation schema is built on first use instead of at import time
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
     # --- Basic fields ---
     element_id: str = Field(default_factory=lambda: f"trace-workflow-{uuid.uuid4()}")
@@ -231,6 +295,11 @@ class BaseTraceWorkflow(BaseModel):
     workflow_nodes: list[BaseWorkflowNode | BaseWorkflowNodeGateway] = Field(default_factory=list)
     workflow_edges: list[BaseWorkflowEdge] = Field(default_factory=list)
 
+    # --- IDs of already stored sub-objects ---
+    workflow_refs: list[str] = Field(default_factory=list)
+    workflow_node_refs: list[str] = Field(default_factory=list)
+    workflow_edge_refs: list[str] = Field(default_factory=list)
+
     # --- Relationship fields ---
     root: ElementComposite | str | None = None
 
@@ -238,6 +307,21 @@ class BaseTraceWorkflow(BaseModel):
     tags: list[str] = Field(default_factory=list)
     attributes: dict[str, Any] = Field(default_factory=dict)
 
+    @model_validator(mode='before')
+    @classmethod
+    def partition_refs(cls, data: Any) -> Any:
+        """Move already stored sub-objects (IDs or composites) given in the builder lists to the ref fields"""
+        if not isinstance(data, dict):
+            return data
+        for field, ref_field in _REF_FIELDS:
+            items = data.get(field)
+            if not items:
+                continue
+            refs, builders = _split_refs(items)
+            if refs:
+                data = {**data, field: builders, ref_field: [*data.get(ref_field, ()), *refs]}
+        return data
+
     def generate_id_prefix(self) -> str:
         """Generate an ID prefix for this trace workflow"""
         return "trace-workflow"
@@ -259,45 +343,17 @@ class BaseTraceWorkflow(BaseModel):
         if not self.description:
             raise ValueError("Trace workflow description must be set before building")
 
-        # Bulk store all sub-objects first and collect their IDs
-
-        # Bulk store workflow builder objects
-        stored_workflow_ids = []
-        if self.workflows:
-            stored_workflows = await BaseWorkflow.bulk_store(data_manager, self.workflows)
-            stored_workflow_ids = [wf.element_id for wf in stored_workflows]
-
-        # Bulk store workflow node builder objects
-        stored_workflow_node_ids = []
-        if self.workflow_nodes:
-            stored_workflow_nodes = await BaseWorkflowNode.bulk_store(data_manager, self.workflow_nodes)
-            stored_workflow_node_ids = [wn.element_id for wn in stored_workflow_nodes]
-
-        # Bulk store workflow edge builder objects
-        stored_workflow_edge_ids = []
-        if self.workflow_edges:
-            stored_workflow_edges = await BaseWorkflowEdge.bulk_store(data_manager, self.workflow_edges)
-            stored_workflow_edge_ids = [we.element_id for we in stored_workflow_edges]
+        # Bulk store the sub-objects that were not stored yet and collect their IDs
+        await _bulk_store_sub_objects(data_manager, self.workflows, self.workflow_nodes, self.workflow_edges)
+        stored_workflow_ids = [*self.workflow_refs, *map(_element_id, self.workflows)]
+        stored_workflow_node_ids = [*self.workflow_node_refs, *map(_element_id, self.workflow_nodes)]
+        stored_workflow_edge_ids = [*self.workflow_edge_refs, *map(_element_id, self.workflow_edges)]
 
         # Process root information
-        root_id = None
-        if self.root is not None:
-            if isinstance(self.root, ElementComposite):
-                root_id = self.root.element_id
-            elif isinstance(self.root, str):
-                root_id = self.root
-            else:
-                raise TypeError("root must be either an Element object or a string ID")
+        root_id = _get_root_id(self.root)
 
         # Process actions IDs
-        actions_ids = []
-        for action in self.actions:
-            if isinstance(action, ActionComposite):
-                actions_ids.append(action.element_id)
-            elif isinstance(action, str):
-                actions_ids.append(action)
-            else:
-                raise TypeError("actions must be either ActionComposite objects or string IDs")
+        actions_ids = list(map(_action_id, self.actions))
 
         # Create trace workflow data directly
         trace_workflow_data = TraceWorkflowData(
@@ -337,107 +393,90 @@ class BaseTraceWorkflow(BaseModel):
         Returns:
             List of created TraceWorkflowComposite objects
         """
-        # Validate all builders before proceeding
-        for base_trace_workflow in base_trace_workflows:
-            if not base_trace_workflow.name:
-                raise ValueError(f"Trace workflow name must be set before building (id: {base_trace_workflow.element_id})")
-            if not base_trace_workflow.description:
-                raise ValueError(f"Trace workflow description must be set before building (id: {base_trace_workflow.element_id})")
+        if not base_trace_workflows:
+            return []
 
-        # Build mappings from trace workflow element_id to its sub-objects
-        trace_workflow_to_workflows = {}
-        trace_workflow_to_workflow_nodes = {}
-        trace_workflow_to_workflow_edges = {}
+        # In a single pass: validate the builders, resolve their root, action and sub-object
+        # IDs and collect all unique sub-objects for bulk storage (first builder per id wins).
+        # Nothing is stored until every builder was validated.
+        workflows_by_id = {}
+        workflow_nodes_by_id = {}
+        workflow_edges_by_id = {}
 
-        for base_trace_workflow in base_trace_workflows:
-            trace_workflow_to_workflows[base_trace_workflow.element_id] = [
-                wf.element_id for wf in base_trace_workflow.workflows
-            ]
-            trace_workflow_to_workflow_nodes[base_trace_workflow.element_id] = [
-                wn.element_id for wn in base_trace_workflow.workflow_nodes
-            ]
-            trace_workflow_to_workflow_edges[base_trace_workflow.element_id] = [
-                we.element_id for we in base_trace_workflow.workflow_edges
-            ]
-
-        # Collect all unique sub-objects for bulk storage (avoid duplicates)
-        all_workflows = []
-        all_workflow_nodes = []
-        all_workflow_edges = []
-
-        seen_workflow_ids = set()
-        seen_workflow_node_ids = set()
-        seen_workflow_edge_ids = set()
+        pending = []
 
         for base_trace_workflow in base_trace_workflows:
+            trace_workflow_id = base_trace_workflow.element_id
+            if not base_trace_workflow.name:
+                raise ValueError(f"Trace workflow name must be set before building (id: {trace_workflow_id})")
+            if not base_trace_workflow.description:
+                raise ValueError(f"Trace workflow description must be set before building (id: {trace_workflow_id})")
+
+            # Already stored sub-objects are used by ID, only the builders need deduplication
+            workflow_ids = list(base_trace_workflow.workflow_refs)
             for workflow in base_trace_workflow.workflows:
-                if workflow.element_id not in seen_workflow_ids:
-                    all_workflows.append(workflow)
-                    seen_workflow_ids.add(workflow.element_id)
+                workflow_ids.append(workflow.element_id)
+                workflows_by_id.setdefault(workflow.element_id, workflow)
 
+            workflow_node_ids = list(base_trace_workflow.workflow_node_refs)
             for workflow_node in base_trace_workflow.workflow_nodes:
-                if workflow_node.element_id not in seen_workflow_node_ids:
-                    all_workflow_nodes.append(workflow_node)
-                    seen_workflow_node_ids.add(workflow_node.element_id)
+                workflow_node_ids.append(workflow_node.element_id)
+                workflow_nodes_by_id.setdefault(workflow_node.element_id, workflow_node)
 
+            workflow_edge_ids = list(base_trace_workflow.workflow_edge_refs)
             for workflow_edge in base_trace_workflow.workflow_edges:
-                if workflow_edge.element_id not in seen_workflow_edge_ids:
-                    all_workflow_edges.append(workflow_edge)
-                    seen_workflow_edge_ids.add(workflow_edge.element_id)
-
-        # Bulk store all unique sub-objects
-        if all_workflows:
-            await BaseWorkflow.bulk_store(data_manager, all_workflows)
-        if all_workflow_nodes:
-            await BaseWorkflowNode.bulk_store(data_manager, all_workflow_nodes)
-        if all_workflow_edges:
-            await BaseWorkflowEdge.bulk_store(data_manager, all_workflow_edges)
-
-        # Create all trace workflow composite objects
-        composite_objects = []
-        for base_trace_workflow in base_trace_workflows:
-            # Process root information
-            root_id = None
-            if base_trace_workflow.root is not None:
-                if isinstance(base_trace_workflow.root, ElementComposite):
-                    root_id = base_trace_workflow.root.element_id
-                elif isinstance(base_trace_workflow.root, str):
-                    root_id = base_trace_workflow.root
-                else:
-                    raise TypeError("root must be either an Element object or a string ID")
-
-            # Process actions IDs
-            actions_ids = []
-            for action in base_trace_workflow.actions:
-                if isinstance(action, ActionComposite):
-                    actions_ids.append(action.element_id)
-                elif isinstance(action, str):
-                    actions_ids.append(action)
-                else:
-                    raise TypeError("actions must be either ActionComposite objects or string IDs")
-
-            # Get sub-object IDs using the pre-built mappings
-            workflow_ids = trace_workflow_to_workflows[base_trace_workflow.element_id]
-            workflow_node_ids = trace_workflow_to_workflow_nodes[base_trace_workflow.element_id]
-            workflow_edge_ids = trace_workflow_to_workflow_edges[base_trace_workflow.element_id]
-
-            # Create trace workflow data
-            trace_workflow_data = TraceWorkflowData(
-                element_id=base_trace_workflow.element_id,
-                root_id=root_id,
-                name=base_trace_workflow.name,
-                description=base_trace_workflow.description,
-                actions=actions_ids,
-                workflows=workflow_ids,
-                workflow_nodes=workflow_node_ids,
-                workflow_edges=workflow_edge_ids,
-                tags=base_trace_workflow.tags or [],
-                attributes=base_trace_workflow.attributes or {},
-            )
-
-            # Create trace workflow instance without storing it
-            composite = TraceWorkflowComposite(data_manager, trace_workflow_data, _token=_CREATION_TOKEN)
-            composite_objects.append(composite)
+                workflow_edge_ids.append(workflow_edge.element_id)
+                workflow_edges_by_id.setdefault(workflow_edge.element_id, workflow_edge)
+
+            pending.append((
+                base_trace_workflow,
+                _get_root_id(base_trace_workflow.root),
+                list(map(_action_id, base_trace_workflow.actions)),
+                workflow_ids,
+                workflow_node_ids,
+                workflow_edge_ids
+            ))
+
+        # Bulk store all unique sub-objects that were not stored yet. The trace workflow data only needs
+        # the sub-object IDs, which the builders already carry, so the composites are built while the
+        # sub-object writes are in flight.
+        sub_objects_task = asyncio.ensure_future(_bulk_store_sub_objects(
+            data_manager,
+            list(workflows_by_id.values()),
+            list(workflow_nodes_by_id.values()),
+            list(workflow_edges_by_id.values())
+        ))
+        # Let the sub-object writes get issued before the loop is busy building composites
+        await asyncio.sleep(0)
+
+        try:
+            # Create all trace workflow composite objects
+            composite_objects = []
+            for base_trace_workflow, root_id, actions_ids, workflow_ids, workflow_node_ids, workflow_edge_ids in pending:
+                # Create trace workflow data - the builders were validated and all values resolved above,
+                # so the data object is constructed without another validation pass
+                trace_workflow_data = TraceWorkflowData.model_construct(
+                    element_id=base_trace_workflow.element_id,
+                    root_id=root_id,
+                    name=base_trace_workflow.name,
+                    description=base_trace_workflow.description,
+                    actions=actions_ids,
+                    workflows=workflow_ids,
+                    workflow_nodes=workflow_node_ids,
+                    workflow_edges=workflow_edge_ids,
+                    tags=base_trace_workflow.tags or [],
+                    attributes=base_trace_workflow.attributes or {},
+                )
+
+                # Create trace workflow instance without storing it
+                composite = TraceWorkflowComposite(data_manager, trace_workflow_data, _token=_CREATION_TOKEN)
+                composite_objects.append(composite)
+        except BaseException:
+            await asyncio.gather(sub_objects_task, return_exceptions=True)
+            raise
+
+        # The trace workflows reference the sub-objects, so they are written only once those are stored
+        await sub_objects_task
 
         # Use the bulk_store method of the data manager
         await data_manager.bulk_store(composite_objects)
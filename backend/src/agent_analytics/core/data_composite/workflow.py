@@ -2,20 +2,62 @@ import json
 from typing import Any, ClassVar
 
 from agent_analytics_common.interfaces.relatable_element import RelatableElement
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from agent_analytics.core.data.workflow_data import WorkflowData
-from agent_analytics.core.data_composite.element import _CREATION_TOKEN, ElementComposite
+from agent_analytics.core.data_composite.element import (
+    _CREATION_TOKEN,
+    ElementComposite,
+    _get_root_id,
+    _StoreTrackedBuilder,
+)
 from agent_analytics.core.data_composite.metric import MetricComposite
 from agent_analytics.core.data_composite.relatable_element import RelatableElementComposite
 from agent_analytics.core.utilities.type_resolver import TypeResolutionUtils
 
 
+def _normalize_related_to(related_to: list[ElementComposite] | tuple[list[str], list[str]] | None,
+                          type_cache: dict[type, str] | None = None) -> tuple[list[str], list[str]]:
+    """
+    Split related_to into its element IDs and fully qualified data type names
+
+    Args:
+        related_to: A list of composite elements or a tuple of (ids, types) lists
+        type_cache: Optional data type to type name cache, shared across the calls of one batch
+
+    Returns:
+        Tuple of the related element IDs and type names
+    """
+    if not related_to:
+        return [], []
+    # Check if related_to is a tuple of (ids, types)
+    if isinstance(related_to, tuple) and len(related_to) == 2:
+        return related_to[0], related_to[1]
+    # Otherwise process as a list of composite elements
+    if not isinstance(related_to, list):
+        raise TypeError("related_to must be either a list of ElementComposite objects or a tuple of (ids, types) lists")
+
+    if type_cache is None:
+        type_cache = {}
+    related_to_ids = []
+    related_to_types = []
+    for element in related_to:
+        related_to_ids.append(element.element_id)
+        data_type = type(element._data_object)
+        type_name = type_cache.get(data_type)
+        if type_name is None:
+            type_name = type_cache[data_type] = TypeResolutionUtils.get_fully_qualified_type_name_for_type(data_type)
+        related_to_types.append(type_name)
+    return related_to_ids, related_to_types
+
+
 class WorkflowComposite(RelatableElementComposite[WorkflowData]):
     """Composite representation of a Task with related Metrics"""
     # Specify the corresponding data class
     data_class: ClassVar[type[WorkflowData]] = WorkflowData
 
+    __slots__ = ()
+
     def __init__(self, data_manager: "DataManager", workflow_data: WorkflowData,*, _token: object = None):
         super().__init__(data_manager, workflow_data, _token=_token)
 
@@ -79,35 +121,9 @@ class WorkflowComposite(RelatableElementComposite[WorkflowData]):
             A new Workflow instance
         """
         # Prepare related_to_ids and related_to_types lists from related_to elements
-        related_to_ids = []
-        related_to_types = []
-
-        if related_to:
-            # Check if related_to is a tuple of (ids, types)
-            if isinstance(related_to, tuple) and len(related_to) == 2:
-                related_to_ids = related_to[0]
-                related_to_types = related_to[1]
-            # Otherwise process as a list of composite elements
-            elif isinstance(related_to, list):
-                for element in related_to:
-                    # Get the element_id from the element
-                    related_to_ids.append(element.element_id)
-
-                    # Get the type name from the element's data object
-                    data_type = type(element._data_object)
-                    type_name = TypeResolutionUtils.get_fully_qualified_type_name_for_type(data_type)
-                    related_to_types.append(type_name)
-            else:
-                raise TypeError("related_to must be either a list of ElementComposite objects or a tuple of (ids, types) lists")
-
-        root_id = None
-        if root is not None:
-            if isinstance(root, ElementComposite):
-                root_id = root.element_id
-            elif isinstance(root, str):
-                root_id = root
-            else:
-                raise TypeError("root must be either an Element object or a string ID")
+        related_to_ids, related_to_types = _normalize_related_to(related_to)
+
+        root_id = _get_root_id(root)
 
         # Create issue data
         workflow_data = WorkflowData(
@@ -137,14 +153,15 @@ class WorkflowComposite(RelatableElementComposite[WorkflowData]):
 
 
 
-class BaseWorkflow(RelatableElement):
+class BaseWorkflow(RelatableElement, _StoreTrackedBuilder):
     """
     Builder class for Issue logical objects.
     
     This class provides a mutable interface that can be used to gather data
     before creating an immutable Issue logical object.
     """
-    model_config = {"arbitrary_types_allowed": True}
+    # The validation schema is built on first use instead of at import time
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
     # ---Additional platform fields
     plugin_metadata_id: str | None = Field(
@@ -188,7 +205,7 @@ class BaseWorkflow(RelatableElement):
             raise ValueError("Issue description must be set before building")
 
         # Create the issue
-        return await WorkflowComposite.create(
+        workflow = await WorkflowComposite.create(
             data_manager=data_manager,
             element_id=self.element_id,
             root=self.root,
@@ -202,6 +219,8 @@ class BaseWorkflow(RelatableElement):
             tags=self.tags,
             **self.attributes
         )
+        self._mark_stored(data_manager)
+        return workflow
 
 
     @classmethod
@@ -226,28 +245,16 @@ class BaseWorkflow(RelatableElement):
 
         # Create all composite objects but don't store them individually
         composite_objects = []
+        # Related element type names, resolved once per data type for the whole batch
+        type_cache = {}
         for base_workflow in base_workflows:
             # Create issue data
-            related_to_ids = []
-            related_to_types = []
-
-            if base_workflow.related_to:
-                # Check if related_to is a tuple of (ids, types)
-                if isinstance(base_workflow.related_to, tuple) and len(base_workflow.related_to) == 2:
-                    related_to_ids = base_workflow.related_to[0]
-                    related_to_types = base_workflow.related_to[1]
-                # Otherwise process as a list of composite elements
-                elif isinstance(base_workflow.related_to, list):
-                    for elem in base_workflow.related_to:
-                        related_to_ids.append(elem.element_id)
-                        type_name = TypeResolutionUtils.get_fully_qualified_type_name_for_type(type(elem._data_object))
-                        related_to_types.append(type_name)
-                else:
-                    raise TypeError("related_to must be either a list of ElementComposite objects or a tuple of (ids, types) lists")
-
-            workflow_data = WorkflowData(
+            related_to_ids, related_to_types = _normalize_related_to(base_workflow.related_to, type_cache)
+
+            # The builders were validated above, so the data object is constructed without another validation pass
+            workflow_data = WorkflowData.model_construct(
                 element_id=base_workflow.element_id,
-                root_id=base_workflow.root.element_id if isinstance(base_workflow.root, ElementComposite) else base_workflow.root,
+                root_id=_get_root_id(base_workflow.root),
                 plugin_metadata_id=base_workflow.plugin_metadata_id,
                 name=base_workflow.name,
                 description=base_workflow.description,
@@ -267,6 +274,8 @@ class BaseWorkflow(RelatableElement):
 
         # Use the bulk_store method of the data manager
         await data_manager.bulk_store(composite_objects)
+        for base_workflow in base_workflows:
+            base_workflow._mark_stored(data_manager)
 
         # Return the created composite objects
         return composite_objects
@@ -1,65 +1,103 @@
-import json
+import sys
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any, ClassVar
 
 from agent_analytics_common.interfaces.elements import Element
 from pydantic import Field
 
 from agent_analytics.core.data.workflow_edge_data import WorkflowEdgeData
-from agent_analytics.core.data_composite.element import _CREATION_TOKEN, ElementComposite
+from agent_analytics.core.data_composite.element import (
+    _CREATION_TOKEN,
+    ElementComposite,
+    _bulk_store_in_chunks,
+    _get_root_id,
+    _StoreTrackedBuilder,
+)
 from agent_analytics.core.data_composite.metric import MetricComposite
+from agent_analytics.core.utilities.batch_writer import BatchWriter
 
+# Builder fields that must be set before building, with their getters
+_REQUIRED_EDGE_FIELDS = ('name', 'description', 'type', 'source_category', 'parent_id', 'source_ids', 'destination_ids', 'destination_category')
+_REQUIRED_EDGE_GETTERS = tuple((field, attrgetter(field)) for field in _REQUIRED_EDGE_FIELDS)
 
-class WorkflowEdgeComposite(ElementComposite[WorkflowEdgeData]):
-    """Composite representation of a WorkflowEdge with related elements"""
-    # Specify the corresponding data class
-    data_class: ClassVar[type[WorkflowEdgeData]] = WorkflowEdgeData
 
-    def __init__(self, data_manager: "DataManager", workflow_edge_data: WorkflowEdgeData, *, _token: object = None):
-        super().__init__(data_manager, workflow_edge_data, _token=_token)
+def _missing_required_field(builder: "BaseWorkflowEdge") -> str | None:
+    """Name of the first required field the builder has not set, None if all are set"""
+    for field, getter in _REQUIRED_EDGE_GETTERS:
+        if not getter(builder):
+            return field
+    return None
 
 
-    @property
-    def type(self) -> str:
-        return self._data_object.relation_type
+def _intern_str(value: str) -> str:
+    """Intern plain strings - str subclasses such as str enums can't be interned"""
+    return sys.intern(value) if type(value) is str else value
 
-    @property
-    def source_category(self) -> str:
-        return self._data_object.source_category
 
-    @property
-    def parent_id(self) -> str:
-        return self._data_object.parent_id
+@lru_cache(maxsize=4096)
+def _interned_ids(ids: tuple[str, ...]) -> tuple[str, ...]:
+    """Intern node IDs - edges of one workflow repeat the same source and destination ID tuples, which are shared"""
+    return tuple(_intern_str(element_id) for element_id in ids)
 
-    @property
-    def source_ids(self) -> list[str]:
-        return self._data_object.source_ids
 
-    @property
-    def destination_ids(self) -> list[str]:
-        return self._data_object.destination_ids
+class WorkflowEdgeComposite(ElementComposite[WorkflowEdgeData]):
+    """Composite representation of a WorkflowEdge with related elements"""
+    # Specify the corresponding data class
+    data_class: ClassVar[type[WorkflowEdgeData]] = WorkflowEdgeData
 
-    @property
-    def destination_category(self) -> str:
-        return self._data_object.destination_category
+    __slots__ = ('_metrics_cache',)
+
+    # Longest time memoized metrics are served - writes made outside the data manager
+    # (another process, a plugin writing to the store) are seen after this at the latest
+    METRICS_MEMO_SECONDS: ClassVar[float] = 5.0
+
+    def __init__(self, data_manager: "DataManager", workflow_edge_data: WorkflowEdgeData, *, _token: object = None):
+        super().__init__(data_manager, workflow_edge_data, _token=_token)
+        # Metrics resolved by the metrics property, stored with the key they were resolved for and their expiry time
+        self._metrics_cache: tuple[tuple, float, list[MetricComposite]] | None = None
+
+    # Plain data accessors, read through C-level attrgetters instead of Python property functions
+    type = property(attrgetter("_data_object.relation_type"))
+    source_category = property(attrgetter("_data_object.source_category"))
+    parent_id = property(attrgetter("_data_object.parent_id"))
+    source_ids = property(attrgetter("_data_object.source_ids"))
+    destination_ids = property(attrgetter("_data_object.destination_ids"))
+    destination_category = property(attrgetter("_data_object.destination_category"))
+    weight = property(attrgetter("_data_object.weight"))
+    trace_count = property(attrgetter("_data_object.trace_count"))
 
-    @property
-    def weight(self) -> int:
-        return self._data_object.weight
-    
-    @property
-    def trace_count(self) -> int:
-        return self._data_object.trace_count
-    
     @property
     async def metrics(self) -> list[MetricComposite]:
         """
-        Get all metrics related to this workflow node.
+        Get all metrics related to this workflow edge.
+
+        The result is memoized until a write goes through the data manager, which may
+        have added metrics for this workflow edge, and for METRICS_MEMO_SECONDS at most.
+        After writes the data manager does not see, call refresh() on the edge or
+        invalidate_caches() on the data manager to read the metrics again right away.
         Returns:
-            List of metrics related to this workflow node
+            List of metrics related to this workflow edge
         """
-        # Use the data manager to retrieve elements related to this task
-        related_elements = await self._data_manager.get_elements_related_to_artifact_and_type(self, MetricComposite)
-        return related_elements
+        write_generation = getattr(self._data_manager, 'write_generation', None)
+        if write_generation is None:
+            return await self._data_manager.get_elements_related_to_artifact_and_type(self, MetricComposite)
+
+        data_object = self._data_object
+        key = (self.element_id, data_object.relation_type, data_object.source_ids, data_object.destination_ids, write_generation)
+        now = time.monotonic()
+        if self._metrics_cache is None or self._metrics_cache[0] != key or self._metrics_cache[1] <= now:
+            # Use the data manager to retrieve elements related to this workflow edge
+            related_elements = await self._data_manager.get_elements_related_to_artifact_and_type(self, MetricComposite)
+            self._metrics_cache = (key, now + self.METRICS_MEMO_SECONDS, related_elements)
+        # Hand out a copy so callers can't alter the cached list
+        return list(self._metrics_cache[2])
+
+    def refresh(self) -> None:
+        """Drop the memoized metrics so the next access re-reads them from the store"""
+        self._metrics_cache = None
 
     @classmethod
     async def create(cls,
@@ -71,12 +109,14 @@ class WorkflowEdgeComposite(ElementComposite[WorkflowEdgeData]):
                     edge_type: str,
                     source_category: str,
                     parent_id: str,
-                    source_ids: list[str],
-                    destination_ids: list[str],
+                    source_ids: Sequence[str],
+                    destination_ids: Sequence[str],
                     destination_category: str,
                     weight: int = 0,
                     trace_count: int = 0,
                     plugin_metadata_id: str | None = None,
+                    tags: list[str] | None = None,
+                    attributes: dict[str, Any] | None = None,
                     **kwargs) -> 'WorkflowEdgeComposite':
         """
         Factory method to create a new WorkflowEdge
@@ -95,19 +135,14 @@ class WorkflowEdgeComposite(ElementComposite[WorkflowEdgeData]):
             destination_category: The category of the destination node
             weight: The weight of the edge (default: 0)
             plugin_metadata_id: Optional plugin metadata identifier
-            **kwargs: Additional attributes for the workflow edge
+            tags: Optional tags classifying the element
+            attributes: Optional element specific attributes, stored as given
+            **kwargs: Additional data fields of the workflow edge
             
         Returns:
             A new WorkflowEdgeComposite instance
         """
-        root_id = None
-        if root is not None:
-            if isinstance(root, ElementComposite):
-                root_id = root.element_id
-            elif isinstance(root, str):
-                root_id = root
-            else:
-                raise TypeError("root must be either an Element object or a string ID")
+        root_id = _get_root_id(root)
 
         # Create workflow edge data
         workflow_edge_data = WorkflowEdgeData(
@@ -123,7 +158,9 @@ class WorkflowEdgeComposite(ElementComposite[WorkflowEdgeData]):
             destination_ids=destination_ids,
             destination_category=destination_category,
             weight=weight,
-            trace_count=trace_count
+            trace_count=trace_count,
+            tags=tags,
+            attributes=attributes if attributes is not None else {},
             **kwargs
         )
 
@@ -137,7 +174,7 @@ class WorkflowEdgeComposite(ElementComposite[WorkflowEdgeData]):
         return workflow_edge
 
 
-class BaseWorkflowEdge(Element):
+class BaseWorkflowEdge(Element, _StoreTrackedBuilder):
     """
     Builder class for WorkflowEdge logical objects.
     
@@ -155,24 +192,43 @@ class BaseWorkflowEdge(Element):
     type: str = Field(description="The type of the workflow edge")
     source_category: str = Field(description="The category of the source node")
     parent_id: str = Field(description="The ID of the parent workflow")
-    source_ids: list[str] = Field(description="List of source node IDs", default_factory=list)
-    destination_ids: list[str] = Field(description="List of destination node IDs", default_factory=list)
+    source_ids: tuple[str, ...] = Field(description="List of source node IDs", default_factory=tuple)
+    destination_ids: tuple[str, ...] = Field(description="List of destination node IDs", default_factory=tuple)
     destination_category: str = Field(description="The category of the destination node")
     weight: int = Field(description="The weight of the edge (as an integer)", default=0)
     trace_count: int = Field(description="The weight of the edge (as an integer)", default=0)
     # --- Relationship fields ---
     root_id: str = Field(description="The ID of the root trace of the workflow")
 
+    # bulk_store builds the data objects without re-validating the already validated builders.
+    # Set to False where builders may have been mutated with unchecked values.
+    _TRUSTED_CONSTRUCT: ClassVar[bool] = True
+
+    # Maximum number of composites sent to the data manager in a single bulk_store call
+    BULK_STORE_CHUNK_SIZE: ClassVar[int] = 500
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> 'BaseWorkflowEdge':
         """Create a builder from a dictionary"""
-        return cls(**data)
+        return cls.model_validate(data)
 
     @classmethod
-    def from_json(cls, json_str: str) -> 'BaseWorkflowEdge':
-        """Create a builder from a JSON string"""
-        data = json.loads(json_str)
-        return cls.from_dict(data)
+    def from_json(cls, json_str: str | bytes | bytearray) -> 'BaseWorkflowEdge':
+        """Create a builder from a JSON string or raw UTF-8 bytes, parsed and validated in a single pass"""
+        return cls.model_validate_json(json_str)
+
+    @classmethod
+    def from_json_iter(cls, lines: Iterable[str | bytes]) -> Iterator['BaseWorkflowEdge']:
+        """Create builders from JSON lines (one object per line), skipping blank lines"""
+        validate_json = cls.model_validate_json
+        for line in lines:
+            if line.strip():
+                yield validate_json(line)
+
+    @classmethod
+    def from_ndjson(cls, buffer: str | bytes) -> list['BaseWorkflowEdge']:
+        """Create builders from a newline delimited JSON buffer, without decoding bytes to a string first"""
+        return list(cls.from_json_iter(buffer.splitlines()))
 
     async def store(self, data_manager: "DataManager") -> WorkflowEdgeComposite:
         """
@@ -184,43 +240,9 @@ class BaseWorkflowEdge(Element):
         Returns:
             The created WorkflowEdge logical object
         """
-        # Validate required fields
-        if not self.name:
-            raise ValueError("WorkflowEdge name must be set before building")
-        if not self.description:
-            raise ValueError("WorkflowEdge description must be set before building")
-        if not self.type:
-            raise ValueError("WorkflowEdge type must be set before building")
-        if not self.source_category:
-            raise ValueError("WorkflowEdge source_category must be set before building")
-        if not self.parent_id:
-            raise ValueError("WorkflowEdge parent_id must be set before building")
-        if not self.source_ids:
-            raise ValueError("WorkflowEdge source_ids must be set before building")
-        if not self.destination_ids:
-            raise ValueError("WorkflowEdge destination_ids must be set before building")
-        if not self.destination_category:
-            raise ValueError("WorkflowEdge destination_category must be set before building")
-
-        # Create the workflow edge
-        return await WorkflowEdgeComposite.create(
-            data_manager=data_manager,
-            element_id=self.element_id,
-            root=self.root_id,
-            plugin_metadata_id=self.plugin_metadata_id,
-            name=self.name,
-            description=self.description,
-            edge_type=self.type,
-            source_category=self.source_category,
-            parent_id=self.parent_id,
-            source_ids=self.source_ids,
-            destination_ids=self.destination_ids,
-            destination_category=self.destination_category,
-            weight=self.weight,
-            trace_count=self.trace_count,
-            tags=self.tags,
-            **self.attributes
-        )
+        # Validated and stored through the bulk path, so both share one implementation
+        stored = await type(self).bulk_store(data_manager, [self])
+        return stored[0]
 
     @classmethod
     async def bulk_store(cls, data_manager: "DataManager", base_workflow_edges: list['BaseWorkflowEdge']) -> list[WorkflowEdgeComposite]:
@@ -236,51 +258,90 @@ class BaseWorkflowEdge(Element):
         """
         # Validate all builders before proceeding
         for base_workflow_edge in base_workflow_edges:
-            if not base_workflow_edge.name:
-                raise ValueError(f"WorkflowEdge name must be set before building (id: {base_workflow_edge.element_id})")
-            if not base_workflow_edge.description:
-                raise ValueError(f"WorkflowEdge description must be set before building (id: {base_workflow_edge.element_id})")
-            if not base_workflow_edge.type:
-                raise ValueError(f"WorkflowEdge type must be set before building (id: {base_workflow_edge.element_id})")
-            if not base_workflow_edge.source_category:
-                raise ValueError(f"WorkflowEdge source_category must be set before building (id: {base_workflow_edge.element_id})")
-            if not base_workflow_edge.parent_id:
-                raise ValueError(f"WorkflowEdge parent_id must be set before building (id: {base_workflow_edge.element_id})")
-            if not base_workflow_edge.source_ids:
-                raise ValueError(f"WorkflowEdge source_ids must be set before building (id: {base_workflow_edge.element_id})")
-            if not base_workflow_edge.destination_ids:
-                raise ValueError(f"WorkflowEdge destination_ids must be set before building (id: {base_workflow_edge.element_id})")
-            if not base_workflow_edge.destination_category:
-                raise ValueError(f"WorkflowEdge destination_category must be set before building (id: {base_workflow_edge.element_id})")
+            missing_field = _missing_required_field(base_workflow_edge)
+            if missing_field:
+                raise ValueError(f"WorkflowEdge {missing_field} must be set before building (id: {base_workflow_edge.element_id})")
 
         # Create all composite objects but don't store them individually
-        composite_objects = []
-        for base_workflow_edge in base_workflow_edges:
-            # Create workflow edge data
-            workflow_edge_data = WorkflowEdgeData(
-                element_id=base_workflow_edge.element_id,
-                root_id=base_workflow_edge.root_id,
-                plugin_metadata_id=base_workflow_edge.plugin_metadata_id,
-                name=base_workflow_edge.name,
-                description=base_workflow_edge.description,
-                relation_type=base_workflow_edge.type,
-                source_category=base_workflow_edge.source_category,
-                parent_id=base_workflow_edge.parent_id,
-                source_ids=base_workflow_edge.source_ids,
-                destination_ids=base_workflow_edge.destination_ids,
-                destination_category=base_workflow_edge.destination_category,
-                weight=base_workflow_edge.weight,
-                trace_count = base_workflow_edge.trace_count,
-                tags=base_workflow_edge.tags or [],
-                attributes=base_workflow_edge.attributes or {},
+        data_factory = WorkflowEdgeData.model_construct if cls._TRUSTED_CONSTRUCT else WorkflowEdgeData
+        composite_objects = [
+            WorkflowEdgeComposite(
+                data_manager,
+                data_factory(
+                    element_id=base_workflow_edge.element_id,
+                    root_id=base_workflow_edge.root_id,
+                    plugin_metadata_id=base_workflow_edge.plugin_metadata_id,
+                    name=base_workflow_edge.name,
+                    description=base_workflow_edge.description,
+                    relation_type=_intern_str(base_workflow_edge.type),
+                    source_category=_intern_str(base_workflow_edge.source_category),
+                    parent_id=_intern_str(base_workflow_edge.parent_id),
+                    source_ids=_interned_ids(base_workflow_edge.source_ids),
+                    destination_ids=_interned_ids(base_workflow_edge.destination_ids),
+                    destination_category=_intern_str(base_workflow_edge.destination_category),
+                    weight=base_workflow_edge.weight,
+                    trace_count=base_workflow_edge.trace_count,
+                    tags=base_workflow_edge.tags or [],
+                    attributes=base_workflow_edge.attributes or {},
+                ),
+                _token=_CREATION_TOKEN
             )
+            for base_workflow_edge in base_workflow_edges
+        ]
 
-            # Create workflow edge instance without storing it
-            composite = WorkflowEdgeComposite(data_manager, workflow_edge_data, _token=_CREATION_TOKEN)
-            composite_objects.append(composite)
-
-        # Use the bulk_store method of the data manager
-        await data_manager.bulk_store(composite_objects)
+        # Store the composite objects in chunks of BULK_STORE_CHUNK_SIZE, the chunks concurrently
+        await _bulk_store_in_chunks(data_manager, composite_objects, cls.BULK_STORE_CHUNK_SIZE)
+        for base_workflow_edge in base_workflow_edges:
+            base_workflow_edge._mark_stored(data_manager)
 
         # Return the created composite objects
         return composite_objects
+
+
+class WorkflowEdgeBatcher:
+    """
+    Coalesces workflow edges stored one at a time into bulk stores.
+
+    Builders passed to store() by callers that emit edges one by one, such as streaming
+    trace ingestion, are buffered for up to window_ms milliseconds or batch_size builders
+    and written with a single BaseWorkflowEdge.bulk_store call. Call flush() at the end
+    of the request to write what is still buffered.
+    """
+
+    def __init__(self, data_manager: "DataManager", batch_size: int = 256, window_ms: float = 10):
+        """
+        Args:
+            data_manager: The data manager to use for storage
+            batch_size: Number of buffered builders that triggers an immediate bulk store
+            window_ms: Maximum time in milliseconds a builder waits in the buffer
+        """
+        self._data_manager = data_manager
+        self._writer: BatchWriter[BaseWorkflowEdge, WorkflowEdgeComposite] = BatchWriter(
+            self._bulk_store,
+            max_batch=batch_size,
+            max_delay=window_ms / 1000
+        )
+
+    async def store(self, base_workflow_edge: BaseWorkflowEdge) -> WorkflowEdgeComposite:
+        """
+        Store a workflow edge as part of the next bulk store.
+
+        Args:
+            base_workflow_edge: The workflow edge builder to store
+
+        Returns:
+            The created WorkflowEdge logical object
+        """
+        # Validate before buffering so an invalid builder does not fail the whole batch
+        missing_field = _missing_required_field(base_workflow_edge)
+        if missing_field:
+            raise ValueError(f"WorkflowEdge {missing_field} must be set before building (id: {base_workflow_edge.element_id})")
+
+        return await self._writer.submit(base_workflow_edge)
+
+    async def flush(self) -> None:
+        """Store all buffered workflow edges now"""
+        await self._writer.flush()
+
+    async def _bulk_store(self, base_workflow_edges: list[BaseWorkflowEdge]) -> list[WorkflowEdgeComposite]:
+        return await BaseWorkflowEdge.bulk_store(self._data_manager, base_workflow_edges)
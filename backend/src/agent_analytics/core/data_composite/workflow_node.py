@@ -1,53 +1,93 @@
-import json
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from operator import attrgetter
 from typing import Any, ClassVar
 
 from agent_analytics_common.interfaces.elements import Element
 from pydantic import Field
 
 from agent_analytics.core.data.workflow_node_data import WorkflowNodeData
-from agent_analytics.core.data_composite.element import _CREATION_TOKEN, ElementComposite
+from agent_analytics.core.data_composite.element import (
+    _CREATION_TOKEN,
+    ElementComposite,
+    _bulk_store_in_chunks,
+    _get_root_id,
+    _StoreTrackedBuilder,
+)
 from agent_analytics.core.data_composite.metric import MetricComposite
 
 
+def _intern_str(value: str) -> str:
+    """Intern plain strings - str subclasses such as str enums can't be interned"""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Builder fields that must be set before building, with their getters
+_REQUIRED_NODE_FIELDS = ('name', 'description', 'type', 'parent_id', 'action_id')
+_REQUIRED_NODE_GETTERS = tuple((field, attrgetter(field)) for field in _REQUIRED_NODE_FIELDS)
+
+
+def _missing_required_field(builder: "BaseWorkflowNode") -> str | None:
+    """Name of the first required field the builder has not set, None if all are set"""
+    for field, getter in _REQUIRED_NODE_GETTERS:
+        if not getter(builder):
+            return field
+    return None
+
+
 class WorkflowNodeComposite(ElementComposite[WorkflowNodeData]):
     """Composite representation of a WorkflowNode with related elements"""
     # Specify the corresponding data class
     data_class: ClassVar[type[WorkflowNodeData]] = WorkflowNodeData
 
-    def __init__(self, data_manager: "DataManager", workflow_node_data: WorkflowNodeData, *, _token: object = None):
-        super().__init__(data_manager, workflow_node_data, _token=_token)
-
-
-    @property
-    def type(self) -> str:
-        return self._data_object.node_type
+    __slots__ = ('_metrics_cache',)
 
-    @property
-    def parent_id(self) -> str:
-        return self._data_object.parent_id
+    # Longest time memoized metrics are served - writes made outside the data manager
+    # (another process, a plugin writing to the store) are seen after this at the latest
+    METRICS_MEMO_SECONDS: ClassVar[float] = 5.0
 
-    @property
-    def action_id(self) -> str:
-        return self._data_object.action_id
+    def __init__(self, data_manager: "DataManager", workflow_node_data: WorkflowNodeData, *, _token: object = None):
+        super().__init__(data_manager, workflow_node_data, _token=_token)
+        # Metrics resolved by the metrics property, stored with the key they were resolved for and their expiry time
+        self._metrics_cache: tuple[tuple, float, list[MetricComposite]] | None = None
 
-    @property
-    def task_counter(self) -> int:
-        return self._data_object.task_counter
+    # Plain data accessors, read through C-level attrgetters instead of Python property functions
+    type = property(attrgetter("_data_object.node_type"))
+    parent_id = property(attrgetter("_data_object.parent_id"))
+    action_id = property(attrgetter("_data_object.action_id"))
+    task_counter = property(attrgetter("_data_object.task_counter"))
+    trace_counter = property(attrgetter("_data_object.trace_counter"))
 
-    @property
-    def trace_counter(self) -> int:
-        return self._data_object.trace_counter
-    
     @property
     async def metrics(self) -> list[MetricComposite]:
         """
         Get all metrics related to this workflow node.
+
+        The result is memoized until a write goes through the data manager, which may
+        have added metrics for this workflow node, and for METRICS_MEMO_SECONDS at most.
+        After writes the data manager does not see, call refresh() on the node or
+        invalidate_caches() on the data manager to read the metrics again right away.
         Returns:
             List of metrics related to this workflow node
         """
-        # Use the data manager to retrieve elements related to this task
-        related_elements = await self._data_manager.get_elements_related_to_artifact_and_type(self, MetricComposite)
-        return related_elements
+        write_generation = getattr(self._data_manager, 'write_generation', None)
+        if write_generation is None:
+            return await self._data_manager.get_elements_related_to_artifact_and_type(self, MetricComposite)
+
+        data_object = self._data_object
+        key = (self.element_id, data_object.node_type, data_object.parent_id, data_object.action_id, write_generation)
+        now = time.monotonic()
+        if self._metrics_cache is None or self._metrics_cache[0] != key or self._metrics_cache[1] <= now:
+            # Use the data manager to retrieve elements related to this workflow node
+            related_elements = await self._data_manager.get_elements_related_to_artifact_and_type(self, MetricComposite)
+            self._metrics_cache = (key, now + self.METRICS_MEMO_SECONDS, related_elements)
+        # Hand out a copy so callers can't alter the cached list
+        return list(self._metrics_cache[2])
+
+    def refresh(self) -> None:
+        """Drop the memoized metrics so the next access re-reads them from the store"""
+        self._metrics_cache = None
 
     @classmethod
     async def create(cls,
@@ -62,6 +102,8 @@ class WorkflowNodeComposite(ElementComposite[WorkflowNodeData]):
                     task_counter: int ,
                     trace_counter: int,
                     plugin_metadata_id: str | None = None,
+                    tags: list[str] | None = None,
+                    attributes: dict[str, Any] | None = None,
                     **kwargs) -> 'WorkflowNodeComposite':
         """
         Factory method to create a new WorkflowNode
@@ -76,19 +118,14 @@ class WorkflowNodeComposite(ElementComposite[WorkflowNodeData]):
             parent_id: The ID of the parent workflow
             action_id: The ID of the associated action
             plugin_metadata_id: Optional plugin metadata identifier
-            **kwargs: Additional attributes for the workflow node
+            tags: Optional tags classifying the element
+            attributes: Optional element specific attributes, stored as given
+            **kwargs: Additional data fields of the workflow node
             
         Returns:
             A new WorkflowNodeComposite instance
         """
-        root_id = None
-        if root is not None:
-            if isinstance(root, ElementComposite):
-                root_id = root.element_id
-            elif isinstance(root, str):
-                root_id = root
-            else:
-                raise TypeError("root must be either an Element object or a string ID")
+        root_id = _get_root_id(root)
 
         # Create workflow node data
         workflow_node_data = WorkflowNodeData(
@@ -102,6 +139,8 @@ class WorkflowNodeComposite(ElementComposite[WorkflowNodeData]):
             task_counter=task_counter,
             trace_counter=trace_counter,
             action_id=action_id,
+            tags=tags,
+            attributes=attributes if attributes is not None else {},
             **kwargs
         )
 
@@ -115,7 +154,7 @@ class WorkflowNodeComposite(ElementComposite[WorkflowNodeData]):
         return workflow_node
 
 
-class BaseWorkflowNode(Element):
+class BaseWorkflowNode(Element, _StoreTrackedBuilder):
     """
     Builder class for WorkflowNode logical objects.
     
@@ -139,16 +178,35 @@ class BaseWorkflowNode(Element):
     # root: Optional[Union[ElementComposite, str]] = None
     root_id: str = Field(description="The ID of the root trace of the workflow")
 
+    # bulk_store builds the data objects without re-validating the already validated builders.
+    # Set to False where builders may have been mutated with unchecked values.
+    _TRUSTED_CONSTRUCT: ClassVar[bool] = True
+
+    # Maximum number of composites sent to the data manager in a single bulk_store call
+    BULK_STORE_CHUNK_SIZE: ClassVar[int] = 500
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> 'BaseWorkflowNode':
         """Create a builder from a dictionary"""
-        return cls(**data)
+        return cls.model_validate(data)
 
     @classmethod
-    def from_json(cls, json_str: str) -> 'BaseWorkflowNode':
-        """Create a builder from a JSON string"""
-        data = json.loads(json_str)
-        return cls.from_dict(data)
+    def from_json(cls, json_str: str | bytes | bytearray) -> 'BaseWorkflowNode':
+        """Create a builder from a JSON string or raw UTF-8 bytes, parsed and validated in a single pass"""
+        return cls.model_validate_json(json_str)
+
+    @classmethod
+    def from_json_iter(cls, lines: Iterable[str | bytes]) -> Iterator['BaseWorkflowNode']:
+        """Create builders from JSON lines (one object per line), skipping blank lines"""
+        validate_json = cls.model_validate_json
+        for line in lines:
+            if line.strip():
+                yield validate_json(line)
+
+    @classmethod
+    def from_ndjson(cls, buffer: str | bytes) -> list['BaseWorkflowNode']:
+        """Create builders from a newline delimited JSON buffer, without decoding bytes to a string first"""
+        return list(cls.from_json_iter(buffer.splitlines()))
 
     async def store(self, data_manager: "DataManager") -> WorkflowNodeComposite:
         """
@@ -160,34 +218,9 @@ class BaseWorkflowNode(Element):
         Returns:
             The created WorkflowNode logical object
         """
-        # Validate required fields
-        if not self.name:
-            raise ValueError("WorkflowNode name must be set before building")
-        if not self.description:
-            raise ValueError("WorkflowNode description must be set before building")
-        if not self.type:
-            raise ValueError("WorkflowNode type must be set before building")
-        if not self.parent_id:
-            raise ValueError("WorkflowNode parent_id must be set before building")
-        if not self.action_id:
-            raise ValueError("WorkflowNode action_id must be set before building")
-
-        # Create the workflow node
-        return await WorkflowNodeComposite.create(
-            data_manager=data_manager,
-            element_id=self.element_id,
-            root=self.root_id,
-            plugin_metadata_id=self.plugin_metadata_id,
-            name=self.name,
-            description=self.description,
-            node_type=self.type,
-            parent_id=self.parent_id,
-            action_id=self.action_id,
-            task_counter=self.task_counter,
-            trace_counter=self.trace_counter,
-            tags=self.tags,
-            **self.attributes
-        )
+        # Validated and stored through the bulk path, so both share one implementation
+        stored = await type(self).bulk_store(data_manager, [self])
+        return stored[0]
 
     @classmethod
     async def bulk_store(cls, data_manager: "DataManager", base_workflow_nodes: list['BaseWorkflowNode']) -> list[WorkflowNodeComposite]:
@@ -203,42 +236,38 @@ class BaseWorkflowNode(Element):
         """
         # Validate all builders before proceeding
         for base_workflow_node in base_workflow_nodes:
-            if not base_workflow_node.name:
-                raise ValueError(f"WorkflowNode name must be set before building (id: {base_workflow_node.element_id})")
-            if not base_workflow_node.description:
-                raise ValueError(f"WorkflowNode description must be set before building (id: {base_workflow_node.element_id})")
-            if not base_workflow_node.type:
-                raise ValueError(f"WorkflowNode type must be set before building (id: {base_workflow_node.element_id})")
-            if not base_workflow_node.parent_id:
-                raise ValueError(f"WorkflowNode parent_id must be set before building (id: {base_workflow_node.element_id})")
-            if not base_workflow_node.action_id:
-                raise ValueError(f"WorkflowNode action_id must be set before building (id: {base_workflow_node.element_id})")
+            missing_field = _missing_required_field(base_workflow_node)
+            if missing_field:
+                raise ValueError(f"WorkflowNode {missing_field} must be set before building (id: {base_workflow_node.element_id})")
 
         # Create all composite objects but don't store them individually
-        composite_objects = []
-        for base_workflow_node in base_workflow_nodes:
-            # Create workflow node data
-            workflow_node_data = WorkflowNodeData(
-                element_id=base_workflow_node.element_id,
-                root_id=base_workflow_node.root_id,
-                plugin_metadata_id=base_workflow_node.plugin_metadata_id,
-                name=base_workflow_node.name,
-                description=base_workflow_node.description,
-                node_type=base_workflow_node.type,
-                parent_id=base_workflow_node.parent_id,
-                action_id=base_workflow_node.action_id,
-                task_counter=base_workflow_node.task_counter,
-                trace_counter = base_workflow_node.trace_counter,
-                tags=base_workflow_node.tags or [],
-                attributes=base_workflow_node.attributes or {},
+        data_factory = WorkflowNodeData.model_construct if cls._TRUSTED_CONSTRUCT else WorkflowNodeData
+        composite_objects = [
+            WorkflowNodeComposite(
+                data_manager,
+                data_factory(
+                    element_id=base_workflow_node.element_id,
+                    root_id=base_workflow_node.root_id,
+                    plugin_metadata_id=base_workflow_node.plugin_metadata_id,
+                    name=base_workflow_node.name,
+                    description=base_workflow_node.description,
+                    node_type=_intern_str(base_workflow_node.type),
+                    parent_id=base_workflow_node.parent_id,
+                    action_id=base_workflow_node.action_id,
+                    task_counter=base_workflow_node.task_counter,
+                    trace_counter=base_workflow_node.trace_counter,
+                    tags=base_workflow_node.tags or [],
+                    attributes=base_workflow_node.attributes or {},
+                ),
+                _token=_CREATION_TOKEN
             )
+            for base_workflow_node in base_workflow_nodes
+        ]
 
-            # Create workflow node instance without storing it
-            composite = WorkflowNodeComposite(data_manager, workflow_node_data, _token=_CREATION_TOKEN)
-            composite_objects.append(composite)
-
-        # Use the bulk_store method of the data manager
-        await data_manager.bulk_store(composite_objects)
+        # Store the composite objects in chunks of BULK_STORE_CHUNK_SIZE, the chunks concurrently
+        await _bulk_store_in_chunks(data_manager, composite_objects, cls.BULK_STORE_CHUNK_SIZE)
+        for base_workflow_node in base_workflow_nodes:
+            base_workflow_node._mark_stored(data_manager)
 
         # Return the created composite objects
         return composite_objects
@@ -1,12 +1,15 @@
-import json
 from typing import Any, ClassVar
 
 from agent_analytics_common.interfaces.iunits import RelationType
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from agent_analytics.core.data.workflow_node_gateway import WorkflowNodeGatewayData
-from agent_analytics.core.data_composite.element import _CREATION_TOKEN, ElementComposite
-from agent_analytics.core.data_composite.workflow_node import BaseWorkflowNode
+from agent_analytics.core.data_composite.element import _CREATION_TOKEN, ElementComposite, _get_root_id
+from agent_analytics.core.data_composite.workflow_node import (
+    BaseWorkflowNode,
+    _intern_str,
+    _missing_required_field,
+)
 
 
 class WorkflowNodeGatewayComposite(ElementComposite[WorkflowNodeGatewayData]):
@@ -14,6 +17,8 @@ class WorkflowNodeGatewayComposite(ElementComposite[WorkflowNodeGatewayData]):
     # Specify the corresponding data class
     data_class: ClassVar[type[WorkflowNodeGatewayData]] = WorkflowNodeGatewayData
 
+    __slots__ = ()
+
     def __init__(self, data_manager: "DataManager", workflow_node__gateway_data: WorkflowNodeGatewayData, *, _token: object = None):
         super().__init__(data_manager, workflow_node__gateway_data, _token=_token)
 
@@ -51,6 +56,8 @@ class WorkflowNodeGatewayComposite(ElementComposite[WorkflowNodeGatewayData]):
                     task_counter: int ,
                     gate_type: RelationType,
                     plugin_metadata_id: str | None = None,
+                    tags: list[str] | None = None,
+                    attributes: dict[str, Any] | None = None,
                     **kwargs) -> 'WorkflowNodeComposite':
         """
         Factory method to create a new WorkflowNode
@@ -65,19 +72,14 @@ class WorkflowNodeGatewayComposite(ElementComposite[WorkflowNodeGatewayData]):
             parent_id: The ID of the parent workflow
             action_id: The ID of the associated action
             plugin_metadata_id: Optional plugin metadata identifier
-            **kwargs: Additional attributes for the workflow node
+            tags: Optional tags classifying the element
+            attributes: Optional element specific attributes, stored as given
+            **kwargs: Additional data fields of the workflow node
             
         Returns:
             A new WorkflowNodeComposite instance
         """
-        root_id = None
-        if root is not None:
-            if isinstance(root, ElementComposite):
-                root_id = root.element_id
-            elif isinstance(root, str):
-                root_id = root
-            else:
-                raise TypeError("root must be either an Element object or a string ID")
+        root_id = _get_root_id(root)
 
         # Create workflow node data
         workflow_node_gateway_data = WorkflowNodeGatewayData(
@@ -90,7 +92,9 @@ class WorkflowNodeGatewayComposite(ElementComposite[WorkflowNodeGatewayData]):
             parent_id=parent_id,
             task_counter=task_counter,
             action_id=action_id,
-            gate_type=gate_type
+            gate_type=gate_type,
+            tags=tags,
+            attributes=attributes if attributes is not None else {},
             **kwargs
         )
 
@@ -111,6 +115,15 @@ class BaseWorkflowNodeGateway(BaseWorkflowNode):
     This class provides a mutable interface that can be used to gather data
     before creating an immutable WorkflowNode logical object.
     """
+    # Gateways are rare next to plain nodes, so the validation schema is built on
+    # first use instead of at import time
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        defer_build=True,
+        extra='ignore',
+        validate_assignment=False
+    )
+
     # --- Fields specific to WorkflowNodeGatewayData ---
     gate_type: RelationType = Field(description="The type of the workflow node gateway")
 
@@ -119,13 +132,12 @@ class BaseWorkflowNodeGateway(BaseWorkflowNode):
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> 'BaseWorkflowNodeGateway':
         """Create a builder from a dictionary"""
-        return cls(**data)
+        return cls.model_validate(data)
 
     @classmethod
-    def from_json(cls, json_str: str) -> 'BaseWorkflowNodeGateway':
-        """Create a builder from a JSON string"""
-        data = json.loads(json_str)
-        return cls.from_dict(data)
+    def from_json(cls, json_str: str | bytes | bytearray) -> 'BaseWorkflowNodeGateway':
+        """Create a builder from a JSON string or raw UTF-8 bytes, parsed and validated in a single pass"""
+        return cls.model_validate_json(json_str)
 
     async def store(self, data_manager: "DataManager") -> WorkflowNodeGatewayComposite:
         """
@@ -138,19 +150,12 @@ class BaseWorkflowNodeGateway(BaseWorkflowNode):
             The created WorkflowNode logical object
         """
         # Validate required fields
-        if not self.name:
-            raise ValueError("WorkflowNode name must be set before building")
-        if not self.description:
-            raise ValueError("WorkflowNode description must be set before building")
-        if not self.type:
-            raise ValueError("WorkflowNode type must be set before building")
-        if not self.parent_id:
-            raise ValueError("WorkflowNode parent_id must be set before building")
-        if not self.action_id:
-            raise ValueError("WorkflowNode action_id must be set before building")
+        missing_field = _missing_required_field(self)
+        if missing_field:
+            raise ValueError(f"WorkflowNode {missing_field} must be set before building")
 
         # Create the workflow node
-        return await WorkflowNodeGatewayComposite.create(
+        workflow_node_gateway = await WorkflowNodeGatewayComposite.create(
             data_manager=data_manager,
             element_id=self.element_id,
             root=self.root_id,
@@ -163,8 +168,10 @@ class BaseWorkflowNodeGateway(BaseWorkflowNode):
             task_counter=self.task_counter,
             gate_type=self.gate_type,
             tags=self.tags,
-            **self.attributes
+            attributes=self.attributes
         )
+        self._mark_stored(data_manager)
+        return workflow_node_gateway
 
     @classmethod
     async def bulk_store(cls, data_manager: "DataManager", base_workflow_nodes: list['BaseWorkflowNodeGateway']) -> list[WorkflowNodeGatewayComposite]:
@@ -180,42 +187,39 @@ class BaseWorkflowNodeGateway(BaseWorkflowNode):
         """
         # Validate all builders before proceeding
         for base_workflow_node in base_workflow_nodes:
-            if not base_workflow_node.name:
-                raise ValueError(f"WorkflowNode name must be set before building (id: {base_workflow_node.element_id})")
-            if not base_workflow_node.description:
-                raise ValueError(f"WorkflowNode description must be set before building (id: {base_workflow_node.element_id})")
-            if not base_workflow_node.type:
-                raise ValueError(f"WorkflowNode type must be set before building (id: {base_workflow_node.element_id})")
-            if not base_workflow_node.parent_id:
-                raise ValueError(f"WorkflowNode parent_id must be set before building (id: {base_workflow_node.element_id})")
-            if not base_workflow_node.action_id:
-                raise ValueError(f"WorkflowNode action_id must be set before building (id: {base_workflow_node.element_id})")
-
-        # Create all composite objects but don't store them individually
-        composite_objects = []
-        for base_workflow_node in base_workflow_nodes:
-            # Create workflow node data
-            workflow_node_data = WorkflowNodeGatewayData(
-                element_id=base_workflow_node.element_id,
-                root_id=base_workflow_node.root_id,
-                plugin_metadata_id=base_workflow_node.plugin_metadata_id,
-                name=base_workflow_node.name,
-                description=base_workflow_node.description,
-                node_type=base_workflow_node.type,
-                parent_id=base_workflow_node.parent_id,
-                action_id=base_workflow_node.action_id,
-                task_counter=base_workflow_node.task_counter,
-                gate_type=base_workflow_node.gate_type,
-                tags=base_workflow_node.tags or [],
-                attributes=base_workflow_node.attributes or {},
+            missing_field = _missing_required_field(base_workflow_node)
+            if missing_field:
+                raise ValueError(f"WorkflowNode {missing_field} must be set before building (id: {base_workflow_node.element_id})")
+
+        # Create all composite objects but don't store them individually. The builders
+        # were validated when they were created, so trusted data objects skip validation.
+        data_factory = WorkflowNodeGatewayData.model_construct if cls._TRUSTED_CONSTRUCT else WorkflowNodeGatewayData
+        composite_objects = [
+            WorkflowNodeGatewayComposite(
+                data_manager,
+                data_factory(
+                    element_id=base_workflow_node.element_id,
+                    root_id=base_workflow_node.root_id,
+                    plugin_metadata_id=base_workflow_node.plugin_metadata_id,
+                    name=base_workflow_node.name,
+                    description=base_workflow_node.description,
+                    node_type=_intern_str(base_workflow_node.type),
+                    parent_id=base_workflow_node.parent_id,
+                    action_id=base_workflow_node.action_id,
+                    task_counter=base_workflow_node.task_counter,
+                    gate_type=base_workflow_node.gate_type,
+                    tags=base_workflow_node.tags or [],
+                    attributes=base_workflow_node.attributes or {},
+                ),
+                _token=_CREATION_TOKEN
             )
-
-            # Create workflow node instance without storing it
-            composite = WorkflowNodeGatewayComposite(data_manager, workflow_node_data, _token=_CREATION_TOKEN)
-            composite_objects.append(composite)
+            for base_workflow_node in base_workflow_nodes
+        ]
 
         # Use the bulk_store method of the data manager
         await data_manager.bulk_store(composite_objects)
+        for base_workflow_node in base_workflow_nodes:
+            base_workflow_node._mark_stored(data_manager)
 
         # Return the created composite objects
         return composite_objects
@@ -7,6 +7,7 @@ from typing import Dict, Any, Optional, List
 from enum import Enum
 from datetime import datetime
 from abc import ABC, abstractmethod
+import time
 import traceback
 
 InputT = TypeVar('InputT', bound=BaseModel)
@@ -23,6 +24,9 @@ class ExecutionStatus(str,Enum):
 
 
 class ExecutionError(BaseModel):
+    # Unknown keyword arguments are dropped and assignments are not re-validated
+    model_config = ConfigDict(extra='ignore', validate_assignment=False)
+
     error_type: str
     message: str
     timestamp: datetime = Field(default_factory=datetime.utcnow)
@@ -38,8 +42,20 @@ class ExecutionError(BaseModel):
         )
 
 
+def _make_result_id(analytics_id: str) -> str:
+    # Nanosecond wall clock in hex - fixed width, so ids of one analytics still sort by
+    # creation time, and far cheaper than formatting a calendar timestamp
+    return f"{analytics_id}_{time.time_ns():x}"
+
+
 class ExecutionResult(BaseModel, Generic[OutputT]):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    # execute() fills config_used, input_data_used and analytics_id in by assignment,
+    # which is not re-validated
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        extra='ignore',
+        validate_assignment=False
+    )
     
     result_id: str = None 
     analytics_id: str
@@ -66,10 +82,11 @@ class ExecutionResult(BaseModel, Generic[OutputT]):
             if self.output is not None:
                 # Access the actual model instance
                 model_instance = self.output
-                if isinstance(model_instance, BaseModel):
-                    self.output_result = model_instance.model_dump()
-                else:
+                if not isinstance(model_instance, BaseModel):
                     raise ValueError("output_model must be a Pydantic BaseModel instance")
+                # An output_result the plugin already serialized is not dumped again
+                if not self.output_result:
+                    self.output_result = model_instance.model_dump()
         elif self.output is not None:
             raise ValueError("output_model should not be provided when status is not SUCCESS")
         return self
@@ -79,8 +96,39 @@ class ExecutionResult(BaseModel, Generic[OutputT]):
             data['start_time'] = datetime.utcnow()
         super().__init__(**data)
         if not self.result_id:
-            timestamp = self.start_time.strftime("%Y%m%d%H%M%S.%f")
-            self.result_id = f"{self.analytics_id}_{timestamp}" 
+            self.result_id = _make_result_id(self.analytics_id)
+
+    @classmethod
+    def success(cls, analytics_id: str, output: OutputT, **fields) -> 'ExecutionResult[OutputT]':
+        """
+        Create a successful result for an output model built by the plugin itself.
+
+        The output is already a validated model, so the result is constructed without
+        running validation again and the output is dumped at most once - not at all
+        when the plugin passes the serialized output_result itself.
+        """
+        if not isinstance(output, BaseModel):
+            raise ValueError("output_model must be a Pydantic BaseModel instance")
+        if not fields.get('output_result'):
+            fields['output_result'] = output.model_dump()
+        return cls._construct(analytics_id, ExecutionStatus.SUCCESS, output=output, **fields)
+
+    @classmethod
+    def failure(cls, analytics_id: str, error: ExecutionError, **fields) -> 'ExecutionResult[OutputT]':
+        """Create a failed result without running validation"""
+        return cls._construct(analytics_id, ExecutionStatus.FAILURE, error=error, **fields)
+
+    @classmethod
+    def _construct(cls, analytics_id: str, status: ExecutionStatus, **fields) -> 'ExecutionResult[OutputT]':
+        start_time = fields.pop('start_time', None) or datetime.utcnow()
+        result_id = fields.pop('result_id', None) or _make_result_id(analytics_id)
+        return cls.model_construct(
+            result_id=result_id,
+            analytics_id=analytics_id,
+            status=status,
+            start_time=start_time,
+            **fields
+        )
                         
     def complete_execution(self, execution_time: float):
         self.execution_time = execution_time
@@ -150,10 +198,6 @@ class BaseAnalyticsPlugin(Generic[InputT, OutputT], ABC):
             return result
             
         except Exception as e:
-            return ExecutionResult(
-                analytics_id=analytics_id,
-                status=ExecutionStatus.FAILURE,
-                error=ExecutionError.from_exception(e)
-            )
+            return ExecutionResult.failure(analytics_id, ExecutionError.from_exception(e))
             
     
\ No newline at end of file
@@ -0,0 +1,87 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from typing import Generic, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    DataLoader-style coalescer for single-key lookups.
+
+    Keys requested with load() during the same event loop tick are collected
+    and resolved together by one call to the batch function, so N concurrent
+    lookups cost a single round-trip to the store instead of N. Results are not
+    kept once a batch is resolved, every batch reads from the store again.
+    """
+
+    def __init__(self, batch_fn: Callable[[list[K]], Awaitable[Mapping[K, V]]]):
+        """
+        Args:
+            batch_fn: Coroutine function receiving the list of unique pending keys
+                      and returning a mapping of key to value. Keys missing from the
+                      mapping resolve to None.
+        """
+        self._batch_fn = batch_fn
+        self._pending: dict[K, list[asyncio.Future]] = {}
+        self._dispatch_scheduled = False
+        # The event loop only keeps weak references to tasks - hold on to the running
+        # batches so they can't be garbage collected while callers wait on them
+        self._in_flight: set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> V | None:
+        """
+        Load a single key, batched with any other keys requested in the same tick.
+
+        Args:
+            key: The key to load
+
+        Returns:
+            The value for the key, or None if the batch function did not return it
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+
+        if not self._dispatch_scheduled:
+            loop.call_soon(self._dispatch)
+            self._dispatch_scheduled = True
+
+        return await future
+
+    async def load_many(self, keys: list[K]) -> list[V | None]:
+        """Load several keys at once, preserving the order of the input keys"""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        try:
+            task = asyncio.ensure_future(self._resolve(pending))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+        except Exception as e:
+            self._fail(pending, e)
+        finally:
+            # Keys loaded from now on are dispatched again, even if this batch could not be
+            self._dispatch_scheduled = False
+
+    async def _resolve(self, pending: dict[K, list[asyncio.Future]]) -> None:
+        try:
+            results = await self._batch_fn(list(pending))
+        except Exception as e:
+            self._fail(pending, e)
+            return
+
+        for key, futures in pending.items():
+            value = results.get(key)
+            for future in futures:
+                if not future.done():
+                    future.set_result(value)
+
+    @staticmethod
+    def _fail(pending: dict[K, list[asyncio.Future]], error: Exception) -> None:
+        for futures in pending.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
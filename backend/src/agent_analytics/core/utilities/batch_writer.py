@@ -0,0 +1,95 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Generic, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+class BatchWriter(Generic[T, R]):
+    """
+    Write-behind coalescer for single-item writes.
+
+    Items submitted concurrently are buffered until either max_batch items are
+    pending or max_delay seconds passed since the first one, and are then written
+    together by one call to the flush function, so N concurrent writes cost a
+    single round-trip to the store instead of N.
+    """
+
+    def __init__(self,
+                 flush_fn: Callable[[list[T]], Awaitable[Sequence[R]]],
+                 max_batch: int = 64,
+                 max_delay: float = 0.005):
+        """
+        Args:
+            flush_fn: Coroutine function receiving the buffered items and returning
+                      one result per item, in the same order
+            max_batch: Number of buffered items that triggers an immediate flush
+            max_delay: Maximum time in seconds an item waits in the buffer
+        """
+        self._flush_fn = flush_fn
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._items: list[T] = []
+        self._futures: list[asyncio.Future] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._in_flight: set[asyncio.Task] = set()
+
+    async def submit(self, item: T) -> R:
+        """
+        Buffer an item for writing and wait until its batch was written.
+
+        Args:
+            item: The item to write
+
+        Returns:
+            The result of the flush function for this item
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._items.append(item)
+        self._futures.append(future)
+
+        if len(self._items) >= self._max_batch:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self._dispatch)
+
+        return await future
+
+    async def flush(self) -> None:
+        """Write all buffered items now and wait for every pending batch to complete"""
+        self._dispatch()
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._items:
+            return
+
+        items, self._items = self._items, []
+        futures, self._futures = self._futures, []
+
+        task = asyncio.ensure_future(self._write(items, futures))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _write(self, items: list[T], futures: list[asyncio.Future]) -> None:
+        try:
+            results = await self._flush_fn(items)
+            if len(results) != len(items):
+                # A short result would leave some callers waiting forever - fail them all
+                raise ValueError(f"Flush function returned {len(results)} results for {len(items)} items")
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, result in zip(futures, results, strict=True):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,27 @@
+import json
+import logging
+from typing import Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    logging.debug("orjson not found. Falling back to the standard json module for parsing.")
+    HAS_ORJSON = False
+
+
+def json_loads(data: str | bytes | bytearray | memoryview) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    Args:
+        data: The JSON document as text or raw UTF-8 bytes
+
+    Returns:
+        The parsed Python object
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
@@ -1,11 +1,60 @@
 import importlib
-from typing import Type
-
-from agent_analytics.core.data.element_data import ElementData
-from agent_analytics.core.data_composite.element import ElementComposite
+from collections import deque
+from functools import cache, lru_cache
 from typing import List, Type
-from agent_analytics.core.data_composite.relatable_element import RelatableElementComposite
+
+from agent_analytics.core.data.element_data import ElementData, class_generation
 from agent_analytics.core.data.relatable_element_data import RelatableElementData
+from agent_analytics.core.data_composite.element import ElementComposite
+from agent_analytics.core.data_composite.relatable_element import (
+    RelatableElementComposite,
+)
+
+
+@cache
+def _fqn_for_type(artifact_type: type) -> str:
+    """Fully qualified name of a type - the set of element types is small and fixed, so it is built once per type"""
+    return f"{artifact_type.__module__}.{artifact_type.__name__}"
+
+
+@lru_cache(maxsize=4096)
+def _resolve_type(fully_qualified_name: str) -> type:
+    """Import and return the type named by a fully qualified name - failures are not cached"""
+    module_path, class_name = fully_qualified_name.rsplit('.', 1)
+    return getattr(importlib.import_module(module_path), class_name)
+
+
+# Storable subclasses per root class, with the class generation they were collected at
+_subclass_cache: dict[type, tuple[int, list[type]]] = {}
+
+
+def _get_all_subclasses(root: type) -> list[type]:
+    """All subclasses of root, breadth first - each class listed once even in diamond hierarchies"""
+    subclasses, seen, pending = [], set(), deque((root,))
+    while pending:
+        for subclass in pending.popleft().__subclasses__():
+            if subclass not in seen:
+                seen.add(subclass)
+                subclasses.append(subclass)
+                pending.append(subclass)
+    return subclasses
+
+
+def _collect_storable(root: type) -> list[type]:
+    """
+    Storable subclasses of root. The hierarchy only changes when element classes
+    are defined, so the walk is redone only after a new class was defined.
+    """
+    generation = class_generation()
+    cached = _subclass_cache.get(root)
+    if cached is None or cached[0] != generation:
+        subclasses = [
+            cls for cls in _get_all_subclasses(root)
+            if getattr(cls, 'is_storable', lambda: True)()
+        ]
+        cached = _subclass_cache[root] = (generation, subclasses)
+    # Callers get their own list so the cached one can't be modified
+    return list(cached[1])
 
 
 class TypeResolutionUtils:
@@ -22,8 +71,7 @@ class TypeResolutionUtils:
         Returns:
             A string representing the fully qualified type name (e.g., 'package.module.ClassName')
         """
-        obj_type = type(obj)
-        return TypeResolutionUtils.get_fully_qualified_type_name_for_type(obj_type)
+        return _fqn_for_type(type(obj))
     
     @staticmethod
     def get_fully_qualified_type_name_for_type(artifact_type: Type[ElementData]) -> str:
@@ -36,9 +84,7 @@ class TypeResolutionUtils:
         Returns:
             A string representing the fully qualified type name (e.g., 'package.module.ClassName')
         """
-        module = artifact_type.__module__
-        class_name = artifact_type.__name__
-        return f"{module}.{class_name}"
+        return _fqn_for_type(artifact_type)
     
     @staticmethod
     def resolve_type_from_fully_qualified_name(fully_qualified_name: str) -> Type[ElementData]:
@@ -55,65 +101,21 @@ class TypeResolutionUtils:
             ValueError: If the type could not be resolved
         """
         try:
-            # Split into module path and class name
-            module_path, class_name = fully_qualified_name.rsplit('.', 1)
-            
-            # Import the module
-            module = importlib.import_module(module_path)
-            
-            # Get the class from the module
-            return getattr(module, class_name)
+            return _resolve_type(fully_qualified_name)
         except (ImportError, AttributeError, ValueError) as e:
             raise ValueError(f"Could not resolve type: {fully_qualified_name}") from e
         
     @staticmethod    
     def get_relatable_element_subclasses() -> List[Type]:
         """Get all subclasses of RelatableElement using __subclasses__()"""
-        
-        def get_all_subclasses(cls):
-            direct_subclasses = cls.__subclasses__()
-            return direct_subclasses + [
-                subclass 
-                for direct in direct_subclasses 
-                for subclass in get_all_subclasses(direct)
-            ]
-        
-        return [
-            cls for cls in get_all_subclasses(RelatableElementComposite) 
-            if getattr(cls, 'is_storable', lambda: True)()
-        ]
+        return _collect_storable(RelatableElementComposite)
     
     @staticmethod    
     def get_relatable_element_data_subclasses() -> List[Type]:
         """Get all subclasses of RelatableElement using __subclasses__()"""
-        
-        def get_all_subclasses(cls):
-            direct_subclasses = cls.__subclasses__()
-            return direct_subclasses + [
-                subclass 
-                for direct in direct_subclasses 
-                for subclass in get_all_subclasses(direct)
-            ]
-        
-        return [
-            cls for cls in get_all_subclasses(RelatableElementData) 
-            if getattr(cls, 'is_storable', lambda: True)()
-        ]
+        return _collect_storable(RelatableElementData)
         
     @staticmethod    
     def get_element_subclasses() -> List[Type[ElementComposite]]:
         """Get all subclasses of RelatableElement using __subclasses__()"""
-        
-        def get_all_subclasses(cls):
-            direct_subclasses = cls.__subclasses__()
-            return direct_subclasses + [
-                subclass 
-                for direct in direct_subclasses 
-                for subclass in get_all_subclasses(direct)
-            ]
-        
-        return [
-            cls for cls in get_all_subclasses(ElementComposite) 
-            if getattr(cls, 'is_storable', lambda: True)()
-        ]
-        
+        return _collect_storable(ElementComposite)
@@ -1,6 +1,8 @@
+import asyncio
+from itertools import chain
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from agent_analytics.core.data_composite.action import BaseAction
 from agent_analytics.core.data.base_data_manager import DataManager
@@ -16,13 +18,15 @@ from agent_analytics.core.plugin.base_plugin import (
     BaseAnalyticsPlugin,
     ExecutionError,
     ExecutionResult,
-    ExecutionStatus,
 )
 from agent_analytics.extensions.causal_discovery.utils import discover_process_workflow
 
 
 class CausalDiscoveryLightInput(BaseModel):
     """Input model for the Causal Discovery Light plugin."""
+    # The validation schema is built on first use instead of at import time
+    model_config = ConfigDict(defer_build=True, extra='ignore', validate_assignment=False)
+
     trace_id: str | None = Field(None, description="A single trace ID to analyze.")
     trace_group_id: str | None = Field(None, description="An ID for a group of traces to analyze together.")
     trace_ids: list[str] | None = Field(None, description="An explicit list of trace IDs to analyze.")
@@ -30,6 +34,8 @@ class CausalDiscoveryLightInput(BaseModel):
 
 
 class CausalDiscoveryLightOutput(BaseModel):
+    model_config = ConfigDict(defer_build=True, extra='ignore', validate_assignment=False)
+
     trace_id: str | None = Field(description="Id of the trace this analytic was run on", default=None)
     trace_group_id: str | None = Field(description="Id of the trace group this analytic was run on", default=None)
     trace_workflow: dict[str, Any] = Field(..., description="List of analyzed tasks")
@@ -41,6 +47,9 @@ class CausalDiscoveryLightPlugin(BaseAnalyticsPlugin):
     hierarchical process workflow from task execution data.
     """
 
+    # Maximum number of traces whose tasks are fetched concurrently
+    MAX_CONCURRENT_TRACE_FETCHES = 16
+
     @classmethod
     def get_input_model(cls) -> type[CausalDiscoveryLightInput]:
         return CausalDiscoveryLightInput
@@ -64,12 +73,11 @@ class CausalDiscoveryLightPlugin(BaseAnalyticsPlugin):
             id = trace_id
             
         # Step 1: Validate input and determine which traces to fetch
-        input_count = sum(1 for v in [input_data.trace_id, input_data.trace_group_id, input_data.trace_ids] if v)
+        input_count = bool(input_data.trace_id) + bool(input_data.trace_group_id) + bool(input_data.trace_ids)
         if input_count != 1:
-            return ExecutionResult(
-                analytics_id=analytics_id,
-                status=ExecutionStatus.FAILURE,
-                error=ExecutionError(
+            return ExecutionResult.failure(
+                analytics_id,
+                ExecutionError(
                     error_type="InputError",
                     message="Exactly one of trace_id, trace_group_id, or trace_ids must be provided."
                 )
@@ -80,10 +88,9 @@ class CausalDiscoveryLightPlugin(BaseAnalyticsPlugin):
             if input_data.trace_group_id:
                 trace_group = await TraceGroupComposite.get_by_id(data_manager, id=input_data.trace_group_id)
                 if not trace_group or not trace_group.traces_ids:
-                    return ExecutionResult(
-                        analytics_id=analytics_id,
-                        status=ExecutionStatus.FAILURE,
-                        error=ExecutionError(
+                    return ExecutionResult.failure(
+                        analytics_id,
+                        ExecutionError(
                             error_type="DataError",
                             message="Trace group not found or is empty."
                         )
@@ -94,18 +101,21 @@ class CausalDiscoveryLightPlugin(BaseAnalyticsPlugin):
             else:
                 trace_ids_to_process = [input_data.trace_id]
 
-            # Step 2: Fetch all tasks from the specified traces
-            all_tasks = []
-            for trace_id_item in trace_ids_to_process:
-                tasks = await BaseTraceComposite.get_tasks_for_trace(data_manager, trace_id=trace_id_item)
-                if tasks:
-                    all_tasks.extend(tasks)
+            # Step 2: Fetch all tasks from the specified traces, several traces at a time.
+            # gather keeps the trace order, so the tasks come out as with sequential fetches.
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_TRACE_FETCHES)
+
+            async def fetch_tasks(trace_id_item: str) -> list:
+                async with semaphore:
+                    return await BaseTraceComposite.get_tasks_for_trace(data_manager, trace_id=trace_id_item)
+
+            task_lists = await asyncio.gather(*(fetch_tasks(trace_id_item) for trace_id_item in trace_ids_to_process))
+            all_tasks = list(chain.from_iterable(tasks for tasks in task_lists if tasks))
 
             if not all_tasks:
-                return ExecutionResult(
-                    analytics_id=analytics_id,
-                    status=ExecutionStatus.FAILURE,
-                    error=ExecutionError(
+                return ExecutionResult.failure(
+                    analytics_id,
+                    ExecutionError(
                         error_type="DataError",
                         message="No tasks found for the provided trace ID(s)."
                     )
@@ -131,21 +141,28 @@ class CausalDiscoveryLightPlugin(BaseAnalyticsPlugin):
             # Now we need to SET the related_to with the persisted actionComposite objects
             action_id_to_composite = {r.element_id: r for r in persisted_actions}
             
-            # Set related_to for each workflow based on its owner_id
+            # Set related_to for each workflow based on its owner_id - a single lookup per
+            # workflow, workflows without an owner simply find no composite
             for workflow in trace_workflow_obj.workflows:
-                if workflow.owner_id and workflow.owner_id in action_id_to_composite:
+                owner_composite = action_id_to_composite.get(workflow.owner_id)
+                if owner_composite is not None:
                     # Set the workflow's related_to to the persisted composite that owns it
-                    workflow.related_to = [action_id_to_composite[workflow.owner_id]]
+                    workflow.related_to = [owner_composite]
             
             # Also update the actions list in trace_workflow_obj
             trace_workflow_obj.actions = persisted_actions
             
             # Step 5: NOW persist the workflow (with references to persisted actions)
-            trace_workflow_composite = await trace_workflow_obj.store(data_manager=data_manager)
-            
             # Step 6: PERSIST THE WORKFLOW NODE METRICS
+            # The metrics depend on neither the persisted actions nor the workflow composite,
+            # so they are stored while the workflow is being stored
             if workflow_metrics:
-                await BaseMetric.bulk_store(data_manager=data_manager, base_metrics=workflow_metrics)
+                trace_workflow_composite, _ = await asyncio.gather(
+                    trace_workflow_obj.store(data_manager=data_manager),
+                    BaseMetric.bulk_store(data_manager=data_manager, base_metrics=workflow_metrics)
+                )
+            else:
+                trace_workflow_composite = await trace_workflow_obj.store(data_manager=data_manager)
             
             # Step 7: Format and return the successful result
             workflow_dict = trace_workflow_composite.model_dump()
@@ -155,14 +172,17 @@ class CausalDiscoveryLightPlugin(BaseAnalyticsPlugin):
                 trace_group_id=trace_group_id if trace_group_id else None,
                 trace_workflow=workflow_dict
             )
-            return ExecutionResult(analytics_id=analytics_id, status=ExecutionStatus.SUCCESS, output=output)
+            # workflow_dict is already a plain dump of the workflow - reuse it instead of
+            # dumping the whole workflow a second time through the output model
+            output_result = output.model_dump(exclude={'trace_workflow'})
+            output_result['trace_workflow'] = workflow_dict
+            return ExecutionResult.success(analytics_id, output, output_result=output_result)
 
         except Exception as e:
             import traceback
-            return ExecutionResult(
-                analytics_id=analytics_id,
-                status=ExecutionStatus.FAILURE,
-                error=ExecutionError(
+            return ExecutionResult.failure(
+                analytics_id,
+                ExecutionError(
                     error_type="ProcessingError",
                     message=f"Failed to discover workflow: {e}",
                     stacktrace=traceback.format_exc()
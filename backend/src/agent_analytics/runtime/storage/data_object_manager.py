@@ -1,12 +1,16 @@
+import asyncio
 import logging
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Mapping
 from datetime import datetime
 from typing import (
+    Any,
     TextIO,
     TypeVar,
     cast,
 )
 
+import numpy as np
+
 from agent_analytics.core.data.base_data_manager import DataManager
 from agent_analytics.core.data.element_data import ElementData
 from agent_analytics.core.data.relatable_element_data import RelatableElementData
@@ -17,16 +21,27 @@ from agent_analytics.core.utilities.type_resolver import TypeResolutionUtils
 from agent_analytics.runtime.utilities.file_loader import TraceLogParser, parse_trace_logs
 
 from .store_config import StoreConfig
-from .store_interface import BaseStore, QueryFilter, QueryOperator, StoreFactory
+from .store_interface import BaseStore, QueryFilter, QueryOperator, SortOrder, StoreFactory
 
 logger = logging.getLogger('data-object-manager')
 logger.setLevel(logging.DEBUG)
 
 E = TypeVar('E', bound=ElementData)
 
+# Paged searches are ordered by element id and continue after the last id seen (keyset paging).
+# Stores don't guarantee a stable order for unsorted results, and skip based paging is bounded
+# by the search backends' result window (index.max_result_window, 10,000 by default)
+_PAGE_KEY = "element_id"
+_PAGE_ORDER = {_PAGE_KEY: SortOrder.ASCENDING}
+
 class PersistentDataManager(DataManager[ElementData]):
     """Implementation of DataManager that works with multiple store implementations"""
 
+    # Number of traces whose spans are fetched by a single (paged) span query
+    TRACE_QUERY_CHUNK_SIZE = 50
+    # Number of spans fetched per store round-trip
+    SPAN_PAGE_SIZE = 1000
+
     def __init__(self):
         self._type_name_to_store: dict[str, BaseStore[ElementData]] = {}
         self._type_tag_to_store: dict[tuple[str, str], BaseStore[ElementData]] = {}
@@ -271,6 +286,46 @@ class PersistentDataManager(DataManager[ElementData]):
 
         return None
 
+    async def get_by_ids(
+        self,
+        element_ids: list[str],
+        artifact_type: type[E],
+        tag: str | None = None
+    ) -> list[E]:
+        """
+        Retrieve several artifacts of the same type with one query per store
+        
+        Args:
+            element_ids: The IDs of the elements to retrieve
+            artifact_type: The type of the artifacts
+            tag: Optional tag to narrow down the store search
+        """
+        if not element_ids:
+            return []
+
+        if not artifact_type.is_storable():
+            artifacts = await asyncio.gather(
+                *(artifact_type.get_by_id(self, element_id) for element_id in element_ids)
+            )
+            return [artifact for artifact in artifacts if artifact is not None]
+
+        stores = self._get_stores_for_type_and_tag(artifact_type, tag)
+
+        # Keep the first match per ID, mirroring the store precedence of get_by_id
+        found: dict[str, E] = {}
+        for store in stores:
+            results = await store.search(
+                query={"element_id": QueryFilter(
+                    operator=QueryOperator.EQUALS_MANY,
+                    value=list(element_ids)
+                )},
+                type_info=artifact_type
+            )
+            for result in results:
+                found.setdefault(result.element_id, result)
+
+        return cast(list[E], list(found.values()))
+
     async def get_children(
         self,
         root_id: str,
@@ -300,6 +355,74 @@ class PersistentDataManager(DataManager[ElementData]):
 
         return cast(list[E], all_results)
 
+    async def iter_children(
+        self,
+        root_id: str,
+        child_type: type[E],
+        tag: str | None = None,
+        page_size: int = 500
+    ) -> AsyncIterator[E]:
+        """
+        Iterate over all children of a specific type for a given parent, one page at a time
+        
+        Args:
+            root_id: The parent ID
+            child_type: The type of children to retrieve
+            tag: Optional tag to narrow down the store search
+            page_size: Number of children fetched per store round-trip
+        """
+        stores = self._get_stores_for_type_and_tag(child_type, tag)
+        query = {"root_id": QueryFilter(
+            operator=QueryOperator.EQUAL,
+            value=root_id
+        )}
+
+        for store in stores:
+            async for page in self._search_pages(store, query, child_type, page_size):
+                for result in page:
+                    yield cast(E, result)
+
+    @staticmethod
+    async def _search_pages(
+        store: BaseStore[ElementData],
+        query: dict[str, QueryFilter],
+        type_info: type[E],
+        page_size: int
+    ) -> AsyncIterator[list[E]]:
+        """
+        Run a store search page by page until it is exhausted
+        
+        Each page asks for the documents after the largest element id seen so far, so no
+        page depends on an offset and result sets beyond the backends' result window stream through.
+        The search ends on the first page that brings no new documents - a short page alone
+        doesn't end it, as stores may cap the page size below the one requested.
+        
+        Args:
+            store: The store to search
+            query: The search query, it must not filter on element_id
+            type_info: The type of the documents to retrieve
+            page_size: Number of documents fetched per store round-trip
+        """
+        last_id = None
+        while True:
+            page_query = query
+            if last_id is not None:
+                page_query = {**query, _PAGE_KEY: QueryFilter(operator=QueryOperator.GREATER, value=last_id)}
+            page = await store.search(
+                query=page_query,
+                type_info=type_info,
+                sort_by=_PAGE_ORDER,
+                limit=page_size
+            )
+            # Stores that ignore the filter would return documents already seen
+            if last_id is not None:
+                page = [document for document in page if document.element_id > last_id]
+            if not page:
+                return
+            last_id = max(document.element_id for document in page)
+
+            yield cast(list[E], page)
+
     async def get_children_for_list(
         self,
         root_ids: list[str],
@@ -544,6 +667,97 @@ class PersistentDataManager(DataManager[ElementData]):
         traces = TraceLogParser.create_traces_from_spans(spans_for_trace)
         return traces[0]
 
+    async def get_traces_by_ids(
+        self,
+        trace_ids: list[str],
+        tag: str | None = None
+    ) -> list[BaseTraceData]:
+        """
+        Return the traces for the given trace ids, fetching all their spans with one query
+        
+        Args:
+            trace_ids: IDs of the traces
+            tag: Optional tag to narrow down which spans to retrieve
+        """
+        if not trace_ids:
+            return []
+
+        # Each query covers a chunk of the traces and is paged until exhausted - a single
+        # unpaged query is capped by the store's default result size, which would
+        # silently drop spans of large trace groups
+        stores = self._get_stores_for_type_and_tag(BaseSpanData, tag)
+        chunk_size = self.TRACE_QUERY_CHUNK_SIZE
+
+        async def get_spans_for_chunk(chunk: list[str]) -> list[BaseSpanData]:
+            query = {"root_id": QueryFilter(
+                operator=QueryOperator.EQUALS_MANY,
+                value=chunk
+            )}
+            chunk_spans = []
+            for store in stores:
+                async for page in self._search_pages(store, query, BaseSpanData, self.SPAN_PAGE_SIZE):
+                    chunk_spans.extend(page)
+            return chunk_spans
+
+        span_chunks = await asyncio.gather(*(
+            get_spans_for_chunk(trace_ids[i:i + chunk_size])
+            for i in range(0, len(trace_ids), chunk_size)
+        ))
+        spans = [span for chunk_spans in span_chunks for span in chunk_spans]
+        return TraceLogParser.create_traces_from_spans(spans)
+
+    async def aggregate_trace_metrics(
+        self,
+        trace_ids: list[str],
+        tag: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Compute aggregate metrics over the given traces, directly on the trace data objects
+        
+        Args:
+            trace_ids: IDs of the traces to aggregate
+            tag: Optional tag to narrow down which spans to retrieve
+        """
+        # Traces that can't be found are skipped, and are not counted in the totals either
+        traces = await self.get_traces_by_ids(trace_ids, tag=tag)
+        if not traces:
+            return {
+                'avg_duration': None,
+                'stddev_duration': None,
+                'min_duration': None,
+                'max_duration': None,
+                'success_rate': None,
+                'total_traces': 0,
+                'failure_count': 0
+            }
+
+        # Only traces with both start_time and end_time contribute to the duration
+        timed_traces = [trace for trace in traces if trace.start_time and trace.end_time]
+        starts = np.fromiter((trace.start_time.timestamp() for trace in timed_traces), dtype=float, count=len(timed_traces))
+        ends = np.fromiter((trace.end_time.timestamp() for trace in timed_traces), dtype=float, count=len(timed_traces))
+        failure_count = int(np.count_nonzero([bool(trace.failures) for trace in traces]))
+
+        total_traces = len(traces)
+        success_rate = (total_traces - failure_count) / total_traces
+
+        avg_duration = stddev_duration = min_duration = max_duration = None
+        if timed_traces:
+            durations = ends - starts
+            avg_duration = float(durations.mean())
+            stddev_duration = float(durations.std())
+            min_duration = float(durations.min())
+            max_duration = float(durations.max())
+
+        return {
+            'avg_duration': avg_duration,
+            'stddev_duration': stddev_duration,
+            'min_duration': min_duration,
+            'max_duration': max_duration,
+            'success_rate': success_rate,
+            'total_traces': total_traces,
+            'failure_count': failure_count
+        }
+
     async def get_related_elements_for_artifact(
         self,
         artifact: RelatableElementData
@@ -19,6 +19,13 @@ from .store_interface import (
 
 force_single_tenant = os.environ.get('FORCE_SINGLE_TENANT', "false").lower() == "true"
 
+# Range query operators by query operator
+_RANGE_OPERATORS = {
+    QueryOperator.GREATER_EQUAL: "gte",
+    QueryOperator.LESS_EQUAL: "lte",
+    QueryOperator.GREATER: "gt",
+}
+
 class ElasticSearchStoreConfig(StoreConfig):
     """Elasticsearch-specific configuration"""
     index_name: str
@@ -82,14 +89,13 @@ class ElasticSearchStore(BaseStore[M]):
         """Translates QueryFilter to Elasticsearch query DSL"""
         if filter.operator == QueryOperator.EQUAL:
             return {"term": {f"{field}": filter.value}}
-        elif filter.operator in (QueryOperator.GREATER_EQUAL, QueryOperator.LESS_EQUAL):
+        elif filter.operator in _RANGE_OPERATORS:
             # Format datetime to ISO format without timezone info
             value = filter.value
             if isinstance(value, datetime):
                 value = value.isoformat()
 
-            range_op = "gte" if filter.operator == QueryOperator.GREATER_EQUAL else "lte"
-            return {"range": {field: {range_op: value}}}
+            return {"range": {field: {_RANGE_OPERATORS[filter.operator]: value}}}
         elif filter.operator == QueryOperator.ARRAY_CONTAINS:
         # For checking if an array field contains a specific value
             return {"match": {f"{field}": filter.value}}
@@ -249,19 +255,11 @@ class ElasticSearchStore(BaseStore[M]):
         body = {"query": es_query}
 
         # Handle sorting
-        # if sort_by:
-        #     if not isinstance(sort_by, dict):
-        #         raise ValueError("The `sort_by` parameter must be a dictionary of field names and sort orders.")
-
-        #     sort_clauses = []
-        #     for field, order in sort_by.items():
-        #         if order not in [SortOrder.ASCENDING, SortOrder.DESCENDING]:
-        #             raise ValueError(f"Invalid sort order for field '{field}'. Use 'asc' or 'desc'.")
-
-        #         sort_clauses.append({field: {"order": order}})
-
-        #     body["sort"] = sort_clauses
-
+        if sort_by:
+            body["sort"] = [
+                {self._translate_field_name(field, type_info): {"order": "asc" if order == SortOrder.ASCENDING else "desc"}}
+                for field, order in sort_by.items()
+            ]
 
         # TODO: Handle pagination
 
@@ -2,9 +2,11 @@
 # AnalyticsDataManager Implementation
 #####################################################
 
+import asyncio
 import inspect
 import logging
-from collections.abc import Callable, Mapping
+import weakref
+from collections.abc import AsyncIterator, Callable, Mapping
 from datetime import datetime
 from typing import (
     Any,
@@ -56,6 +58,32 @@ class AnalyticsDataManager(DataManager[ElementComposite]):
         # Initialize the mapping
         self._initialize_type_mappings()
 
+        # Live composites by (element type, element ID), so repeated lookups of an element that is
+        # still referenced somewhere skip the store round-trip. Entries go away with their composites.
+        self._identity: weakref.WeakValueDictionary[tuple[type, str], ElementComposite] = weakref.WeakValueDictionary()
+
+        # Incremented on every write, so composites can tell whether results they memoized may be stale
+        self._write_generation = 0
+
+    @property
+    def write_generation(self) -> int:
+        """Counter of the writes made through this data manager"""
+        return self._write_generation
+
+    def invalidate_caches(self) -> None:
+        """
+        Mark the results composites memoized as stale, so their next access reads the store again.
+
+        Writes made through this data manager do this already. Call it after writes it can't see,
+        e.g. metrics stored by another process or by a plugin writing to the store directly.
+        """
+        self._write_generation += 1
+
+    def _remember(self, element: ElementComposite) -> ElementComposite:
+        """Register a composite in the identity cache and return it"""
+        self._identity[(type(element), element.element_id)] = element
+        return element
+
     @classmethod
     async def create(
         cls,
@@ -122,6 +150,8 @@ class AnalyticsDataManager(DataManager[ElementComposite]):
         Tags are extracted from the data object by persistent manager
         """
         await self._persistent_manager.store(element._data_object)
+        self._write_generation += 1
+        self._remember(element)
 
     async def get_by_id(
         self,
@@ -142,6 +172,10 @@ class AnalyticsDataManager(DataManager[ElementComposite]):
         if not data_class.is_storable():
             return await element_type.get_by_id(self, element_id)
 
+        element = self._identity.get((element_type, element_id))
+        if element is not None:
+            return element
+
         data_object = await self._persistent_manager.get_by_id(
             element_id,
             data_class,
@@ -151,7 +185,56 @@ class AnalyticsDataManager(DataManager[ElementComposite]):
         if data_object is None:
             return None
 
-        return element_type(self, data_object, _token=_CREATION_TOKEN)
+        return self._remember(element_type(self, data_object, _token=_CREATION_TOKEN))
+
+    async def get_by_ids(
+        self,
+        element_ids: list[str],
+        element_type: type[T],
+        tag: str | None = None
+    ) -> list[T]:
+        """
+        Get several elements of the same type by their IDs with a single query
+        
+        Args:
+            element_ids: The IDs of the elements
+            element_type: The type of the elements
+            tag: Optional tag to narrow down the store search
+        """
+        if not element_ids:
+            return []
+
+        data_class = self._get_data_class_for_element(element_type)
+
+        if not data_class.is_storable():
+            elements = await asyncio.gather(
+                *(element_type.get_by_id(self, element_id) for element_id in element_ids)
+            )
+            return [element for element in elements if element is not None]
+
+        # Only the elements that are not cached go to the store
+        cached = []
+        missing_ids = []
+        for element_id in element_ids:
+            element = self._identity.get((element_type, element_id))
+            if element is None:
+                missing_ids.append(element_id)
+            else:
+                cached.append(element)
+
+        if not missing_ids:
+            return cached
+
+        data_objects = await self._persistent_manager.get_by_ids(
+            missing_ids,
+            data_class,
+            tag=tag
+        )
+
+        return cached + [
+            self._remember(element_type(self, data_object, _token=_CREATION_TOKEN))
+            for data_object in data_objects
+        ]
 
     async def get_children(
         self,
@@ -180,6 +263,32 @@ class AnalyticsDataManager(DataManager[ElementComposite]):
             for data_object in data_objects
         ]
 
+    async def iter_children(
+        self,
+        root_id: str,
+        child_type: type[T],
+        tag: str | None = None,
+        page_size: int = 500
+    ) -> AsyncIterator[T]:
+        """
+        Iterate over all children of a specific type for a given parent, one page at a time
+        
+        Args:
+            root_id: The parent ID
+            child_type: The type of children
+            tag: Optional tag to narrow down the store search
+            page_size: Number of children fetched per store round-trip
+        """
+        data_class = self._get_data_class_for_element(child_type)
+
+        async for data_object in self._persistent_manager.iter_children(
+            root_id,
+            data_class,
+            tag=tag,
+            page_size=page_size
+        ):
+            yield child_type(self, data_object, _token=_CREATION_TOKEN)
+
     async def get_children_for_list(
         self,
         root_ids: list[str],
@@ -269,10 +378,17 @@ class AnalyticsDataManager(DataManager[ElementComposite]):
 
         data_objects = [element._data_object for element in elements]
 
-        return await self._persistent_manager.bulk_store(
+        stored_ids = await self._persistent_manager.bulk_store(
             data_objects,
             ignore_duplicates=ignore_duplicates
         )
+        self._write_generation += 1
+        # With ignore_duplicates the store may have kept an older version, so nothing is cached then
+        if not ignore_duplicates:
+            for element in elements:
+                self._remember(element)
+
+        return stored_ids
 
     async def get_related_elements(
         self,
@@ -536,6 +652,42 @@ class AnalyticsDataManager(DataManager[ElementComposite]):
         trace_data = await self._persistent_manager.get_trace(trace_id, tag=tag)
         return BaseTraceComposite(self, trace_data, _token=_CREATION_TOKEN)
 
+    async def aggregate_trace_metrics(
+        self,
+        trace_ids: list[str],
+        tag: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Compute aggregate metrics over the given traces
+        
+        Args:
+            trace_ids: IDs of the traces to aggregate
+            tag: Optional tag to narrow down which spans to retrieve
+        """
+        return await self._persistent_manager.aggregate_trace_metrics(trace_ids, tag=tag)
+
+    async def get_traces_by_ids(
+        self,
+        trace_ids: list[str],
+        tag: str | None = None
+    ) -> list[ElementComposite]:
+        """
+        Return the trace objects for the given trace ids
+        
+        Args:
+            trace_ids: IDs of the traces
+            tag: Optional tag to narrow down which spans to retrieve
+        """
+        trace_data_objects = await self._persistent_manager.get_traces_by_ids(
+            trace_ids,
+            tag=tag
+        )
+
+        return [
+            BaseTraceComposite(self, trace_data, _token=_CREATION_TOKEN)
+            for trace_data in trace_data_objects
+        ]
+
     async def delete(
         self,
         element_id: str,
@@ -550,4 +702,5 @@ class AnalyticsDataManager(DataManager[ElementComposite]):
             element_type: Type of the element
             tag: Optional tag to narrow down the store search
         """
-        pass
+        self._write_generation += 1
+        self._identity.pop((element_type, element_id), None)
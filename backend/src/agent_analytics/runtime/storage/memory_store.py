@@ -1,3 +1,4 @@
+import operator
 import os
 from collections.abc import Sequence
 from copy import deepcopy
@@ -15,6 +16,13 @@ from .store_interface import (
     StoreFactory,
 )
 
+# Comparison operators by query operator, applied to numbers, strings and datetimes alike
+_COMPARISONS = {
+    QueryOperator.GREATER_EQUAL: operator.ge,
+    QueryOperator.LESS_EQUAL: operator.le,
+    QueryOperator.GREATER: operator.gt,
+}
+
 
 class MemoryStore(BaseStore[M]):
     """In-memory implementation of BaseStore using a dictionary as storage with tenant isolation"""
@@ -198,13 +206,11 @@ class MemoryStore(BaseStore[M]):
             return False
 
         # For comparison operators, handle type-specific comparisons
-        if filter_.operator in [QueryOperator.GREATER_EQUAL, QueryOperator.LESS_EQUAL]:
+        compare = _COMPARISONS.get(filter_.operator)
+        if compare is not None:
             # Both are numeric types (int, float)
             if isinstance(value, (int, float)) and isinstance(filter_value, (int, float)):
-                if filter_.operator == QueryOperator.GREATER_EQUAL:
-                    return value >= filter_value
-                else:  # LESS_EQUAL
-                    return value <= filter_value
+                return compare(value, filter_value)
 
             # Both are strings
             elif isinstance(value, str) and isinstance(filter_value, str):
@@ -213,10 +219,7 @@ class MemoryStore(BaseStore[M]):
                     value = value.lower()
                     filter_value = filter_value.lower()
 
-                if filter_.operator == QueryOperator.GREATER_EQUAL:
-                    return value >= filter_value
-                else:  # LESS_EQUAL
-                    return value <= filter_value
+                return compare(value, filter_value)
 
             # Both are datetime objects
             elif isinstance(value, datetime) and isinstance(filter_value, datetime):
@@ -224,10 +227,7 @@ class MemoryStore(BaseStore[M]):
                 if value.tzinfo is None and filter_value.tzinfo is not None:
                     value = value.replace(tzinfo=UTC)
 
-                if filter_.operator == QueryOperator.GREATER_EQUAL:
-                    return value >= filter_value
-                else:  # LESS_EQUAL
-                    return value <= filter_value
+                return compare(value, filter_value)
 
             # Types don't match or aren't comparable
             return False
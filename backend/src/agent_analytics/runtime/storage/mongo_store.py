@@ -53,6 +53,8 @@ class MongoStore(BaseStore[M]):
             return {"$gte": value.value}
         elif value.operator == QueryOperator.LESS_EQUAL:
             return {"$lte": value.value}
+        elif value.operator == QueryOperator.GREATER:
+            return {"$gt": value.value}
         elif value.operator == QueryOperator.ARRAY_CONTAINS:
             # For MongoDB, to check if an array field contains a value
             return value.value 
@@ -16,6 +16,13 @@ from .store_interface import (
     StoreFactory,
 )
 
+# Range query operators by query operator
+_RANGE_OPERATORS = {
+    QueryOperator.GREATER_EQUAL: "gte",
+    QueryOperator.LESS_EQUAL: "lte",
+    QueryOperator.GREATER: "gt",
+}
+
 
 class OpenSearchStoreConfig(StoreConfig):
     """OpenSearch-specific configuration"""
@@ -74,14 +81,13 @@ class OpenSearchStore(BaseStore[M]):
         """Translates QueryFilter to OpenSearch query DSL"""
         if filter.operator == QueryOperator.EQUAL:
             return {"term": {f"{field}": filter.value}}
-        elif filter.operator in (QueryOperator.GREATER_EQUAL, QueryOperator.LESS_EQUAL):
+        elif filter.operator in _RANGE_OPERATORS:
             # Format datetime to ISO format without timezone info
             value = filter.value
             if isinstance(value, datetime):
                 value = value.isoformat()
 
-            range_op = "gte" if filter.operator == QueryOperator.GREATER_EQUAL else "lte"
-            return {"range": {field: {range_op: value}}}
+            return {"range": {field: {_RANGE_OPERATORS[filter.operator]: value}}}
         elif filter.operator == QueryOperator.ARRAY_CONTAINS:
             # For checking if an array field contains a specific value
             return {"match": {f"{field}": filter.value}}
@@ -216,6 +222,13 @@ class OpenSearchStore(BaseStore[M]):
         # Construct request body
         body = {"query": os_query}
 
+        # Handle sorting
+        if sort_by:
+            body["sort"] = [
+                {self._translate_field_name(field, type_info): {"order": "asc" if order == SortOrder.ASCENDING else "desc"}}
+                for field, order in sort_by.items()
+            ]
+
         # Handle pagination
         from_ = skip
         size_ = limit or 10_000  # Default max size
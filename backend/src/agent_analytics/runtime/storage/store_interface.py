@@ -24,6 +24,7 @@ class DuplicateKeyException(StoreException):
 class QueryOperator(Enum):
     EQUAL = "eq"
     GREATER_EQUAL = "gte"
+    GREATER = "gt"
     LESS_EQUAL = "lte"
     ARRAY_CONTAINS = "array_contains"
     EQUALS_MANY = "eqm"
@@ -463,7 +463,7 @@ class TraceWorkflow(Element):
         Example:
             nodes = await workflow.nodes
         """
-        node_composites = await self._composite.workflow_nodes
+        node_composites = await self._composite.workflow_nodes()
         return [WorkflowNode(_composite=nc) for nc in node_composites]
 
     @property
@@ -477,7 +477,7 @@ class TraceWorkflow(Element):
         Example:
             edges = await workflow.edges
         """
-        edge_composites = await self._composite.workflow_edges
+        edge_composites = await self._composite.workflow_edges()
         return [WorkflowEdge(_composite=ec) for ec in edge_composites]
 
     async def get_node(self, name: str) -> "WorkflowNode | None":
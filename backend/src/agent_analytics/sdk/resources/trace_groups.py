@@ -121,7 +121,7 @@ class TraceGroupsResource:
                 workflow = await transform_workflow(workflow_obj)
 
                 # Get metrics from workflow nodes
-                nodes = await workflow_obj.workflow_nodes
+                nodes = await workflow_obj.workflow_nodes()
                 nodes_metrics = [await node.metrics for node in nodes]
                 flat_metric_list = [metric for metric_list in nodes_metrics for metric in metric_list]
 
@@ -14,7 +14,7 @@ async def rebuild_action_workflow_mapping(workflow: TraceWorkflowComposite):
         Dict mapping action element_ids to their workflow objects
     """
     actions = await workflow.get_actions()
-    workflows = await workflow.workflows
+    workflows = await workflow.workflows()
     
     # Create mapping from action ID to workflow
     action_to_workflow = {}
@@ -89,7 +89,7 @@ async def transform_workflow(workflow: TraceWorkflowComposite):
     actions_by_id = { action.element_id: action for action in actions}
     # CRITICAL FIX: Build action-to-workflow mapping for aggregated views
     action_to_workflow_map = await rebuild_action_workflow_mapping(workflow)
-    workflow_nodes = await workflow.workflow_nodes
+    workflow_nodes = await workflow.workflow_nodes()
     workflow_nodes_by_id = {n.element_id: n for n in workflow_nodes}
 
     # Group workflow nodes by parent workflow
@@ -106,7 +106,7 @@ async def transform_workflow(workflow: TraceWorkflowComposite):
 
     # Group workflow edges by parent workflow
     edges_by_workflow = {}
-    workflow_edges = await workflow.workflow_edges
+    workflow_edges = await workflow.workflow_edges()
     for edge in workflow_edges:
         if edge.parent_id:
             workflow_id = edge.parent_id
@@ -258,7 +258,7 @@ async def transform_workflow(workflow: TraceWorkflowComposite):
 
     # Find the root workflow
     root_workflow = None
-    workflows = await workflow.workflows
+    workflows = await workflow.workflows()
     for workflow_item in workflows:
         if workflow_item.name and "_ROOT" in workflow_item.name:
             root_workflow = workflow_item
@@ -737,7 +737,7 @@ class RuntimeClient:
         else:
             workflow_obj = await BaseTraceComposite.get_all_workflows_for_trace(tenant_components.data_manager, group_id)
 
-        nodes = await workflow_obj[0].workflow_nodes
+        nodes = await workflow_obj[0].workflow_nodes()
         nodes_metrics = [await node.metrics for node in nodes]
 
         # Check if workflow metrics analytics has already run successfully
@@ -781,7 +781,7 @@ class RuntimeClient:
             else:
                 workflow_obj = await BaseTraceComposite.get_all_workflows_for_trace(tenant_components.data_manager, group_id)
 
-            nodes = await workflow_obj[0].workflow_nodes
+            nodes = await workflow_obj[0].workflow_nodes()
             nodes_metrics = [await node.metrics for node in nodes]
 
         return [metric for metric_list in nodes_metrics for metric in metric_list]
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from agent_analytics.core.utilities.batch_loader import BatchLoader
+
+
+class RecordingBatchFn:
+    """Batch function returning key * 10 for every key, recording the batches it received"""
+
+    def __init__(self, error: Exception | None = None):
+        self.batches: list[list[int]] = []
+        self.error = error
+
+    async def __call__(self, keys: list[int]) -> dict[int, int]:
+        self.batches.append(keys)
+        await asyncio.sleep(0)
+        if self.error:
+            raise self.error
+        return {key: key * 10 for key in keys if key >= 0}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_are_coalesced_into_one_batch():
+    batch_fn = RecordingBatchFn()
+    loader = BatchLoader(batch_fn)
+
+    results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(3))
+
+    assert results == [10, 20, 30]
+    assert batch_fn.batches == [[1, 2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_keys_are_requested_once_and_resolve_every_waiter():
+    batch_fn = RecordingBatchFn()
+    loader = BatchLoader(batch_fn)
+
+    results = await loader.load_many([1, 2, 1, 1])
+
+    assert results == [10, 20, 10, 10]
+    assert batch_fn.batches == [[1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_missing_keys_resolve_to_none():
+    loader = BatchLoader(RecordingBatchFn())
+
+    assert await loader.load_many([1, -1]) == [10, None]
+
+
+@pytest.mark.asyncio
+async def test_batch_error_propagates_to_every_waiter():
+    error = RuntimeError("store unavailable")
+    loader = BatchLoader(RecordingBatchFn(error))
+
+    results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1), return_exceptions=True)
+
+    assert results == [error, error, error]
+
+
+@pytest.mark.asyncio
+async def test_loads_in_later_ticks_start_a_new_batch():
+    batch_fn = RecordingBatchFn()
+    loader = BatchLoader(batch_fn)
+
+    assert await loader.load(1) == 10
+    assert await loader.load(2) == 20
+    assert batch_fn.batches == [[1], [2]]
+
+    # Finished batches are no longer held once their done callbacks ran
+    await asyncio.sleep(0)
+    assert not loader._in_flight
+
+
+@pytest.mark.asyncio
+async def test_loads_after_a_failed_dispatch_are_dispatched_again(monkeypatch):
+    batch_fn = RecordingBatchFn()
+    loader = BatchLoader(batch_fn)
+    ensure_future = asyncio.ensure_future
+
+    def fail_once(coroutine):
+        monkeypatch.setattr(asyncio, "ensure_future", ensure_future)
+        coroutine.close()
+        raise RuntimeError("dispatch failed")
+
+    monkeypatch.setattr(asyncio, "ensure_future", fail_once)
+
+    with pytest.raises(RuntimeError, match="dispatch failed"):
+        await asyncio.wait_for(loader.load(1), timeout=1)
+    assert await asyncio.wait_for(loader.load(2), timeout=1) == 20
+    assert batch_fn.batches == [[2]]
+
+
+@pytest.mark.asyncio
+async def test_every_batch_reads_from_the_batch_function_again():
+    batch_fn = RecordingBatchFn()
+    loader = BatchLoader(batch_fn)
+
+    await loader.load(1)
+    await loader.load(1)
+
+    assert batch_fn.batches == [[1], [1]]
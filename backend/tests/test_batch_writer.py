@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from agent_analytics.core.utilities.batch_writer import BatchWriter
+
+
+class RecordingFlushFn:
+    """Flush function returning item * 10 for every item, recording the batches it received"""
+
+    def __init__(self, error: Exception | None = None, drop_last: bool = False):
+        self.batches: list[list[int]] = []
+        self.error = error
+        self.drop_last = drop_last
+
+    async def __call__(self, items: list[int]) -> list[int]:
+        self.batches.append(items)
+        await asyncio.sleep(0)
+        if self.error:
+            raise self.error
+        results = [item * 10 for item in items]
+        return results[:-1] if self.drop_last else results
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_flushed_without_waiting_for_the_timer():
+    flush_fn = RecordingFlushFn()
+    writer = BatchWriter(flush_fn, max_batch=3, max_delay=60)
+
+    results = await asyncio.wait_for(asyncio.gather(*(writer.submit(i) for i in range(3))), timeout=1)
+
+    assert results == [0, 10, 20]
+    assert flush_fn.batches == [[0, 1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_is_flushed_by_the_timer():
+    flush_fn = RecordingFlushFn()
+    writer = BatchWriter(flush_fn, max_batch=100, max_delay=0.01)
+
+    results = await asyncio.wait_for(asyncio.gather(writer.submit(1), writer.submit(2)), timeout=1)
+
+    assert results == [10, 20]
+    assert flush_fn.batches == [[1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_batches_beyond_max_batch_are_split():
+    flush_fn = RecordingFlushFn()
+    writer = BatchWriter(flush_fn, max_batch=2, max_delay=0.01)
+
+    results = await asyncio.wait_for(asyncio.gather(*(writer.submit(i) for i in range(5))), timeout=1)
+
+    assert results == [0, 10, 20, 30, 40]
+    assert flush_fn.batches == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_buffered_items_immediately():
+    flush_fn = RecordingFlushFn()
+    writer = BatchWriter(flush_fn, max_batch=100, max_delay=60)
+
+    pending = asyncio.ensure_future(writer.submit(1))
+    await asyncio.sleep(0)
+    await asyncio.wait_for(writer.flush(), timeout=1)
+
+    assert await pending == 10
+
+
+@pytest.mark.asyncio
+async def test_flush_error_propagates_to_every_caller():
+    error = RuntimeError("store unavailable")
+    writer = BatchWriter(RecordingFlushFn(error), max_batch=3, max_delay=60)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(writer.submit(i) for i in range(3)), return_exceptions=True), timeout=1
+    )
+
+    assert results == [error, error, error]
+
+
+@pytest.mark.asyncio
+async def test_short_flush_result_fails_every_caller():
+    writer = BatchWriter(RecordingFlushFn(drop_last=True), max_batch=3, max_delay=60)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(writer.submit(i) for i in range(3)), return_exceptions=True), timeout=1
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
@@ -0,0 +1,97 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from agent_analytics.core.data.span_data import BaseSpanData
+from agent_analytics.runtime.storage.data_object_manager import PersistentDataManager
+from agent_analytics.runtime.storage.memory_store import MemoryStore
+
+# Largest page a store returns, whatever limit is asked for, like the Elasticsearch store
+STORE_DEFAULT_LIMIT = 25
+# Deepest result a store can page to with skip, like the backends' index.max_result_window
+STORE_RESULT_WINDOW = 50
+
+
+class UnorderedCappedStore(MemoryStore):
+    """
+    Memory store behaving like the search backends: unsorted results come back in
+    a different order on every request, pages are capped, and skip can't reach
+    beyond the result window
+    """
+
+    async def search(self, query, type_info=None, sort_by=None, skip=0, limit=None):
+        size = min(limit or STORE_DEFAULT_LIMIT, STORE_DEFAULT_LIMIT)
+        if skip + size > STORE_RESULT_WINDOW:
+            raise ValueError(f"Result window is too large, skip + limit must be at most {STORE_RESULT_WINDOW}")
+        results = await super().search(query, type_info=type_info, sort_by=sort_by)
+        if not sort_by:
+            random.shuffle(results)
+        return results[skip:skip + size]
+
+
+def make_span(trace_id: str, index: int) -> BaseSpanData:
+    start_time = datetime(2025, 1, 1) + timedelta(seconds=index)
+    return BaseSpanData(
+        name=f"span-{index}",
+        context={"trace_id": trace_id, "span_id": f"{trace_id}-span-{index:04d}"},
+        kind="SpanKind.INTERNAL",
+        start_time=start_time,
+        end_time=start_time + timedelta(seconds=1),
+        status={"status_code": "OK"},
+        resource={"attributes": {"service.name": "service"}},
+    )
+
+
+async def make_manager(spans: list[BaseSpanData]) -> PersistentDataManager:
+    store = UnorderedCappedStore(id_field="element_id", model_class=BaseSpanData, tenant_id="tenant")
+    await store.bulk_store(spans, type_info=BaseSpanData)
+    manager = PersistentDataManager()
+    manager._default_store = store
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_iter_children_returns_every_child_once():
+    spans = [make_span("trace-1", i) for i in range(3 * STORE_DEFAULT_LIMIT + 7)]
+    manager = await make_manager(spans)
+
+    children = [child async for child in manager.iter_children("trace-1", BaseSpanData, page_size=10)]
+
+    assert sorted(child.element_id for child in children) == sorted(span.element_id for span in spans)
+
+
+@pytest.mark.asyncio
+async def test_iter_children_continues_past_pages_shorter_than_requested():
+    spans = [make_span("trace-1", i) for i in range(3 * STORE_DEFAULT_LIMIT + 7)]
+    manager = await make_manager(spans)
+
+    children = [child async for child in manager.iter_children("trace-1", BaseSpanData, page_size=40)]
+
+    assert sorted(child.element_id for child in children) == sorted(span.element_id for span in spans)
+
+
+@pytest.mark.asyncio
+async def test_get_traces_by_ids_loads_spans_beyond_one_page(monkeypatch):
+    monkeypatch.setattr(PersistentDataManager, "TRACE_QUERY_CHUNK_SIZE", 2)
+    monkeypatch.setattr(PersistentDataManager, "SPAN_PAGE_SIZE", 10)
+    spans_per_trace = {f"trace-{t}": STORE_DEFAULT_LIMIT + t for t in range(5)}
+    spans = [make_span(trace_id, i) for trace_id, count in spans_per_trace.items() for i in range(count)]
+    manager = await make_manager(spans)
+
+    traces = await manager.get_traces_by_ids(list(spans_per_trace))
+
+    assert {trace.element_id: trace.num_of_spans for trace in traces} == spans_per_trace
+
+
+@pytest.mark.asyncio
+async def test_aggregate_trace_metrics_counts_only_loaded_traces():
+    spans = [make_span("trace-1", i) for i in range(3)] + [make_span("trace-2", i) for i in range(2)]
+    manager = await make_manager(spans)
+
+    metrics = await manager.aggregate_trace_metrics(["trace-1", "trace-2", "trace-missing"])
+
+    assert metrics['total_traces'] == 2
+    assert metrics['failure_count'] == 0
+    assert metrics['success_rate'] == 1.0
+    assert metrics['max_duration'] == 3.0
@@ -0,0 +1,27 @@
+from agent_analytics.core.data_composite.task import HierarchicalTask
+
+
+def test_flatten_does_not_share_mutable_containers():
+    task = HierarchicalTask(name="task", tags=["a"], attributes={"k": 1}, events=[], metadata={})
+    flattened = task.flatten()
+
+    task.add_tag(["b"])
+    task.attributes["k2"] = 2
+    task.events.append("event")
+    task.metadata["m"] = 1
+
+    assert flattened.tags == ["a"]
+    assert flattened.attributes == {"k": 1}
+    assert flattened.events == []
+    assert flattened.metadata == {}
+
+
+def test_add_tag_keeps_order_and_does_not_mutate_shared_list():
+    shared_tags = ["a", "b"]
+    task = HierarchicalTask(name="task")
+    task.tags = shared_tags
+
+    task.add_tag(["c", "a", "d"])
+
+    assert task.tags == ["a", "b", "c", "d"]
+    assert shared_tags == ["a", "b"]
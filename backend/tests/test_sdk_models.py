@@ -0,0 +1,68 @@
+import pytest
+
+from agent_analytics.core.data.trace_workflow_data import TraceWorkflowData
+from agent_analytics.core.data.workflow_edge_data import WorkflowEdgeData
+from agent_analytics.core.data.workflow_node_data import WorkflowNodeData
+from agent_analytics.core.data_composite.element import _CREATION_TOKEN
+from agent_analytics.core.data_composite.trace_workflow import TraceWorkflowComposite
+from agent_analytics.core.data_composite.workflow_edge import WorkflowEdgeComposite
+from agent_analytics.core.data_composite.workflow_node import WorkflowNodeComposite
+from agent_analytics.sdk.models import TraceWorkflow, WorkflowEdge, WorkflowNode
+
+
+class InMemoryDataManager:
+    def __init__(self, composites):
+        self.by_id = {composite.element_id: composite for composite in composites}
+
+    async def get_by_ids(self, element_ids, element_type):
+        return [
+            self.by_id[element_id] for element_id in element_ids
+            if isinstance(self.by_id.get(element_id), element_type)
+        ]
+
+
+def make_workflow() -> TraceWorkflow:
+    data_manager = InMemoryDataManager([])
+    node = WorkflowNodeComposite(
+        data_manager,
+        WorkflowNodeData.model_construct(element_id="node-1", root_id="trace-1", name="DecisionNode",
+                                         node_type="task", parent_id="workflow-1", action_id="action-1"),
+        _token=_CREATION_TOKEN,
+    )
+    edge = WorkflowEdgeComposite(
+        data_manager,
+        WorkflowEdgeData.model_construct(element_id="edge-1", root_id="trace-1", name="edge",
+                                         source_category="task", destination_category="task", parent_id="workflow-1"),
+        _token=_CREATION_TOKEN,
+    )
+    data_manager.by_id.update({node.element_id: node, edge.element_id: edge})
+    composite = TraceWorkflowComposite(
+        data_manager,
+        TraceWorkflowData.model_construct(element_id="trace-workflow-1", root_id="trace-1", name="workflow",
+                                          workflow_nodes=["node-1"], workflow_edges=["edge-1"]),
+        _token=_CREATION_TOKEN,
+    )
+    return TraceWorkflow(_composite=composite)
+
+
+@pytest.mark.asyncio
+async def test_trace_workflow_nodes_and_edges_wrap_the_related_composites():
+    workflow = make_workflow()
+
+    nodes = await workflow.nodes
+    edges = await workflow.edges
+
+    assert [type(node) for node in nodes] == [WorkflowNode]
+    assert [node.element_id for node in nodes] == ["node-1"]
+    assert [type(edge) for edge in edges] == [WorkflowEdge]
+    assert [edge.element_id for edge in edges] == ["edge-1"]
+
+
+@pytest.mark.asyncio
+async def test_trace_workflow_get_node_finds_node_by_name():
+    workflow = make_workflow()
+
+    node = await workflow.get_node("DecisionNode")
+
+    assert node is not None
+    assert node.element_id == "node-1"
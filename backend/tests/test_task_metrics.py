@@ -0,0 +1,38 @@
+import pytest
+
+from agent_analytics.core.data.task_data import TaskData
+from agent_analytics.core.data_composite.element import _CREATION_TOKEN
+from agent_analytics.core.data_composite.metric import BaseNumericMetric
+from agent_analytics.core.data_composite.task import TaskComposite
+
+
+class RecordingDataManager:
+    def __init__(self):
+        self.stored = []
+
+    async def store(self, composite):
+        self.stored.append(composite)
+
+    async def bulk_store(self, composites):
+        self.stored.extend(composites)
+
+
+def make_task(data_manager) -> TaskComposite:
+    task_data = TaskData.model_construct(element_id="task-1", root_id="trace-1", name="task", related_to_ids=[])
+    return TaskComposite(data_manager, task_data, _token=_CREATION_TOKEN)
+
+
+def make_metric(name: str) -> BaseNumericMetric:
+    return BaseNumericMetric(element_id="", name=name, description="a metric", value=1.0)
+
+
+@pytest.mark.asyncio
+async def test_default_metric_ids_keep_their_established_shape():
+    task = make_task(RecordingDataManager())
+
+    single = await task.add_metric(make_metric("Step Count"))
+    many = await task.add_metrics([make_metric("Token Count")])
+
+    # Ids stay as earlier releases generated them, so re-runs update the stored metrics
+    assert single.element_id == "metric-task-1-step-count"
+    assert [metric.element_id for metric in many] == ["Metric-task-1-token-count"]
@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from agent_analytics.core.data.task_data import TaskData
+from agent_analytics.core.data_composite.element import _CREATION_TOKEN
+from agent_analytics.core.data_composite.task import TaskComposite, _parent_loaders
+
+
+class SearchCountingDataManager:
+    def __init__(self):
+        self.tasks = {}
+        self.searches = 0
+
+    async def search(self, element_type, query):
+        self.searches += 1
+        return [self.tasks[task_id] for task_id in query["id"].value if task_id in self.tasks]
+
+
+def make_task(data_manager, element_id: str, parent_id: str | None = None) -> TaskComposite:
+    task_data = TaskData.model_construct(
+        element_id=element_id, id=element_id, root_id="trace-1", name=element_id, parent_id=parent_id, related_to_ids=[]
+    )
+    task = TaskComposite(data_manager, task_data, _token=_CREATION_TOKEN)
+    data_manager.tasks[element_id] = task
+    return task
+
+
+@pytest.mark.asyncio
+async def test_concurrent_parent_lookups_share_one_search_and_later_ones_search_again():
+    data_manager = SearchCountingDataManager()
+    make_task(data_manager, "parent-1")
+    make_task(data_manager, "parent-2")
+    first, second = make_task(data_manager, "child-1", "parent-1"), make_task(data_manager, "child-2", "parent-2")
+
+    parents = await asyncio.gather(first.parent, second.parent)
+    assert [parent.element_id for parent in parents] == ["parent-1", "parent-2"]
+    assert data_manager.searches == 1
+    # The loader served its batch only
+    assert data_manager not in _parent_loaders
+
+    # A parent written after the first batch is found by the next lookup
+    make_task(data_manager, "parent-3")
+    late = make_task(data_manager, "child-3", "parent-3")
+    assert (await late.parent).element_id == "parent-3"
+    assert data_manager.searches == 2
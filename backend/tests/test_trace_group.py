@@ -0,0 +1,31 @@
+import re
+
+import pytest
+
+from agent_analytics.core.data_composite.trace_group import (
+    BaseTraceGroup,
+    TraceGroupComposite,
+)
+
+GENERATED_ID = re.compile(r"^trace-group-checkout-[0-9a-f]{8}(-[0-9a-f]{4}){3}-[0-9a-f]{12}$")
+
+
+class RecordingDataManager:
+    def __init__(self):
+        self.stored = []
+
+    async def store(self, composite):
+        self.stored.append(composite)
+
+
+@pytest.mark.asyncio
+async def test_factory_and_builder_generate_ids_of_the_same_shape():
+    created = await TraceGroupComposite.create(RecordingDataManager(), service_name="checkout")
+    built = BaseTraceGroup(service_name="checkout")
+
+    assert GENERATED_ID.match(created.element_id)
+    assert GENERATED_ID.match(built.id)
+
+
+def test_builder_keeps_a_given_id():
+    assert BaseTraceGroup(id="Group:nightly", service_name="checkout").id == "Group:nightly"
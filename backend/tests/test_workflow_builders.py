@@ -0,0 +1,82 @@
+import pytest
+
+from agent_analytics.core.data_composite.trace_workflow import _bulk_store_if_any
+from agent_analytics.core.data_composite.workflow_edge import BaseWorkflowEdge
+from agent_analytics.core.data_composite.workflow_node import BaseWorkflowNode
+
+
+class RecordingDataManager:
+    def __init__(self):
+        self.stored = []
+
+    async def bulk_store(self, composites):
+        self.stored.extend(composites)
+
+
+def make_node() -> BaseWorkflowNode:
+    return BaseWorkflowNode(
+        name="node", description="a node", type="task", parent_id="workflow-1", action_id="action-1", root_id="trace-1"
+    )
+
+
+@pytest.mark.asyncio
+async def test_shared_builder_is_stored_once_per_data_manager():
+    node = make_node()
+    first, second = RecordingDataManager(), RecordingDataManager()
+
+    await _bulk_store_if_any(BaseWorkflowNode, first, [node])
+    await _bulk_store_if_any(BaseWorkflowNode, first, [node])
+    await _bulk_store_if_any(BaseWorkflowNode, second, [node])
+
+    assert len(first.stored) == 1
+    assert len(second.stored) == 1
+
+
+@pytest.mark.asyncio
+async def test_edited_builder_is_stored_again():
+    node = make_node()
+    data_manager = RecordingDataManager()
+
+    await _bulk_store_if_any(BaseWorkflowNode, data_manager, [node])
+    node.task_counter = 5
+    await _bulk_store_if_any(BaseWorkflowNode, data_manager, [node])
+
+    assert [composite.task_counter for composite in data_manager.stored] == [0, 5]
+
+
+@pytest.mark.asyncio
+async def test_builder_edited_in_place_is_stored_again():
+    node = make_node()
+    node.tags = ["nightly"]
+    data_manager = RecordingDataManager()
+
+    await _bulk_store_if_any(BaseWorkflowNode, data_manager, [node])
+    node.tags.append("retried")
+    await _bulk_store_if_any(BaseWorkflowNode, data_manager, [node])
+    node.attributes["attempt"] = 2
+    await _bulk_store_if_any(BaseWorkflowNode, data_manager, [node])
+    await _bulk_store_if_any(BaseWorkflowNode, data_manager, [node])
+
+    assert len(data_manager.stored) == 3
+
+
+class Category(str):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_edge_builder_stores_str_subclass_ids():
+    edge = BaseWorkflowEdge(
+        name="edge", description="an edge", type="sequence", source_category="task", destination_category="task",
+        parent_id="workflow-1", source_ids=["node-1"], destination_ids=["node-2"], root_id="trace-1",
+    )
+    # Assignment is not validated, so the builder keeps the subclass instances
+    edge.parent_id = Category("workflow-1")
+    edge.source_ids = (Category("node-1"),)
+    data_manager = RecordingDataManager()
+
+    await _bulk_store_if_any(BaseWorkflowEdge, data_manager, [edge])
+
+    [composite] = data_manager.stored
+    assert composite.parent_id == "workflow-1"
+    assert composite.source_ids == ("node-1",)
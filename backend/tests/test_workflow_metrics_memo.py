@@ -0,0 +1,52 @@
+import pytest
+
+from agent_analytics.core.data.workflow_edge_data import WorkflowEdgeData
+from agent_analytics.core.data_composite.element import _CREATION_TOKEN
+from agent_analytics.core.data_composite.workflow_edge import WorkflowEdgeComposite
+
+
+class CountingDataManager:
+    def __init__(self):
+        self.write_generation = 0
+        self.lookups = 0
+
+    def invalidate_caches(self):
+        self.write_generation += 1
+
+    async def get_elements_related_to_artifact_and_type(self, artifact, element_type):
+        self.lookups += 1
+        return []
+
+
+def make_edge(data_manager) -> WorkflowEdgeComposite:
+    edge_data = WorkflowEdgeData.model_construct(
+        element_id="edge-1", root_id="trace-1", name="edge", relation_type="sequence",
+        source_ids=("node-1",), destination_ids=("node-2",),
+    )
+    return WorkflowEdgeComposite(data_manager, edge_data, _token=_CREATION_TOKEN)
+
+
+@pytest.mark.asyncio
+async def test_metrics_are_memoized_until_the_data_manager_invalidates_them():
+    data_manager = CountingDataManager()
+    edge = make_edge(data_manager)
+
+    await edge.metrics
+    await edge.metrics
+    assert data_manager.lookups == 1
+
+    data_manager.invalidate_caches()
+    await edge.metrics
+    assert data_manager.lookups == 2
+
+
+@pytest.mark.asyncio
+async def test_memoized_metrics_expire(monkeypatch):
+    monkeypatch.setattr(WorkflowEdgeComposite, "METRICS_MEMO_SECONDS", 0.0)
+    data_manager = CountingDataManager()
+    edge = make_edge(data_manager)
+
+    await edge.metrics
+    await edge.metrics
+
+    assert data_manager.lookups == 2